@@ -9,7 +9,7 @@ Buttons are awarded for groups of 3 adjacent tiles of the same color.
 """
 from typing import List, Tuple, Set, Dict, FrozenSet
 from hex_grid import HexGrid
-from tile import Color
+from tile import Color, ALL_COLORS
 
 
 BUTTON_POINTS = 3
@@ -117,7 +117,7 @@ def count_buttons_by_color(grid: HexGrid) -> Dict[Color, int]:
     """
     button_counts = {}
 
-    for color in Color:
+    for color in ALL_COLORS:
         # Each color tracks its own used tiles independently
         groups = find_color_groups(grid, color, set())
         button_counts[color] = len(groups)
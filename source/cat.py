@@ -2,13 +2,14 @@ import random
 from typing import List, Tuple, Set, FrozenSet
 from abc import ABC, abstractmethod
 from hex_grid import Pattern, HexGrid, ALL_3_LINES, ALL_4_LINES, ALL_5_LINES
+from tile import ALL_PATTERNS
 
 
 class Cat(ABC):
     def __init__(self, name: str, point_value: int, patterns: tuple[Pattern, Pattern] = None):
         self.name = name
         self.point_value = point_value
-        self.patterns = patterns if patterns else tuple(random.sample(list(Pattern), 2))
+        self.patterns = patterns if patterns else tuple(random.sample(ALL_PATTERNS, 2))
 
     @abstractmethod
     def find_all_groups(self, grid: HexGrid, used_tiles: Set[Tuple[int, int, int]]) -> List[FrozenSet[Tuple[int, int, int]]]:
@@ -67,7 +68,7 @@ class CatMillie(Cat):
     Scores 3 points per valid group.
     """
     def __init__(self):
-        patterns = random.sample(list(Pattern), 2)
+        patterns = random.sample(ALL_PATTERNS, 2)
         super().__init__("Millie", 3, tuple(patterns))
 
     def find_all_groups(self, grid: HexGrid, used_tiles: Set[Tuple[int, int, int]]) -> List[FrozenSet[Tuple[int, int, int]]]:
@@ -168,7 +169,7 @@ class CatLeo(Cat):
     Scores 11 points per valid group.
     """
     def __init__(self):
-        super().__init__("Leo", 11, tuple(random.sample(list(Pattern), 2)))
+        super().__init__("Leo", 11, tuple(random.sample(ALL_PATTERNS, 2)))
 
     def find_all_groups(self, grid: HexGrid, used_tiles: Set[Tuple[int, int, int]]) -> List[FrozenSet[Tuple[int, int, int]]]:
         """Find all valid 5-tile lines using pre-computed line positions."""
@@ -214,7 +215,7 @@ class CatRumi(Cat):
     Scores 5 points per valid group.
     """
     def __init__(self):
-        super().__init__("Rumi", 5, tuple(random.sample(list(Pattern), 2)))
+        super().__init__("Rumi", 5, tuple(random.sample(ALL_PATTERNS, 2)))
 
     def find_all_groups(self, grid: HexGrid, used_tiles: Set[Tuple[int, int, int]]) -> List[FrozenSet[Tuple[int, int, int]]]:
         """Find all valid 3-tile lines using pre-computed line positions."""
@@ -257,7 +258,7 @@ class CatTecolote(Cat):
     Scores 7 points per valid group.
     """
     def __init__(self):
-        super().__init__("Tecolote", 7, tuple(random.sample(list(Pattern), 2)))
+        super().__init__("Tecolote", 7, tuple(random.sample(ALL_PATTERNS, 2)))
 
     def find_all_groups(self, grid: HexGrid, used_tiles: Set[Tuple[int, int, int]]) -> List[FrozenSet[Tuple[int, int, int]]]:
         """Find all valid 4-tile lines using pre-computed line positions."""
@@ -329,7 +330,7 @@ def initialize_game_cats(use_buckets: bool = True) -> Tuple[List[Cat], List[Patt
         chosen_cats = random.sample(ALL_CATS, 3)
 
     # Shuffle patterns and assign 2 to each cat (non-overlapping)
-    all_patterns = list(Pattern)
+    all_patterns = list(ALL_PATTERNS)
     random.shuffle(all_patterns)
 
     cats = []
@@ -11,11 +11,27 @@ This module supports:
 - Extensible for future additions (new cat types, goal types, etc.)
 """
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import json
 
+try:
+    import orjson  # Optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
 
-@dataclass
+# MLflow parameter names per slot, built once (up to 9 cats / goals)
+_MAX_PARAM_SLOTS = 9
+_CAT_PARAM_KEYS = tuple(
+    (f"cat_{i}_name", f"cat_{i}_points", f"cat_{i}_patterns")
+    for i in range(1, _MAX_PARAM_SLOTS + 1)
+)
+_GOAL_PARAM_KEYS = tuple(
+    (f"goal_{i}_name", f"goal_{i}_position")
+    for i in range(1, _MAX_PARAM_SLOTS + 1)
+)
+
+
+@dataclass(slots=True)
 class GameMetadata:
     """
     Complete game configuration metadata.
@@ -26,7 +42,7 @@ class GameMetadata:
     # Cat information
     cat_names: List[str] = field(default_factory=list)
     cat_points: List[int] = field(default_factory=list)
-    cat_patterns: List[List[str]] = field(default_factory=list)
+    cat_patterns: Tuple[Tuple[str, ...], ...] = ()  # Immutable: hashable, cheap equality
 
     # Goal information
     goal_names: List[str] = field(default_factory=list)
@@ -35,6 +51,10 @@ class GameMetadata:
     # Board information
     board_name: str = "BOARD_1"
 
+    def __post_init__(self):
+        # Normalise list input (e.g. decoded JSON) so equality is type-stable
+        self.cat_patterns = tuple(tuple(p) for p in self.cat_patterns)
+
     @classmethod
     def from_game(cls, game) -> 'GameMetadata':
         """
@@ -49,7 +69,9 @@ class GameMetadata:
         for cat in game.cats:
             metadata.cat_names.append(cat.name)
             metadata.cat_points.append(cat.point_value)
-            metadata.cat_patterns.append([p.name for p in cat.patterns])
+        metadata.cat_patterns = tuple(
+            tuple(p.name for p in cat.patterns) for cat in game.cats
+        )
 
         # Extract goal info
         for goal in game.goals:
@@ -73,19 +95,19 @@ class GameMetadata:
         params = {}
 
         # Cat parameters
-        for i, (name, points, patterns) in enumerate(
-            zip(self.cat_names, self.cat_points, self.cat_patterns), start=1
+        for (name_key, points_key, patterns_key), name, points, patterns in zip(
+            _CAT_PARAM_KEYS, self.cat_names, self.cat_points, self.cat_patterns
         ):
-            params[f"cat_{i}_name"] = name
-            params[f"cat_{i}_points"] = points
-            params[f"cat_{i}_patterns"] = ",".join(patterns)
+            params[name_key] = name
+            params[points_key] = points
+            params[patterns_key] = ",".join(patterns)
 
         # Goal parameters
-        for i, (name, position) in enumerate(
-            zip(self.goal_names, self.goal_positions), start=1
+        for (name_key, position_key), name, position in zip(
+            _GOAL_PARAM_KEYS, self.goal_names, self.goal_positions
         ):
-            params[f"goal_{i}_name"] = name
-            params[f"goal_{i}_position"] = ",".join(str(p) for p in position)
+            params[name_key] = name
+            params[position_key] = ",".join(map(str, position))
 
         # Board
         params["board_name"] = self.board_name
@@ -114,11 +136,11 @@ class GameMetadata:
         Returns string like "AAA-BBB@(-2,1,1)|AA-BB-CC@(1,-1,0)|All Unique@(0,1,-1)"
         This allows filtering/grouping by specific goal arrangements.
         """
-        parts = []
-        for name, pos in zip(self.goal_names, self.goal_positions):
-            pos_str = f"({pos[0]},{pos[1]},{pos[2]})"
-            parts.append(f"{name}@{pos_str}")
-        return "|".join(sorted(parts))  # Sort for consistent ordering
+        parts = sorted(  # Sort for consistent ordering
+            f"{name}@({pos[0]},{pos[1]},{pos[2]})"
+            for name, pos in zip(self.goal_names, self.goal_positions)
+        )
+        return "|".join(parts)
 
     def get_setup_key(self) -> str:
         """
@@ -141,13 +163,21 @@ class GameMetadata:
         return ",".join(sorted(self.goal_names))
 
     def to_json(self) -> str:
-        """Serialize to JSON string for storage."""
-        return json.dumps(asdict(self))
+        """
+        Serialize to JSON string for storage.
+
+        Both backends write compact, non-ASCII-escaped JSON. Without orjson
+        this replaces the json.dumps defaults (", " separators, \\uXXXX
+        escapes) used before; from_json() reads either form.
+        """
+        if orjson is not None:
+            return orjson.dumps(asdict(self)).decode()
+        return json.dumps(asdict(self), separators=(",", ":"), ensure_ascii=False)
 
     @classmethod
     def from_json(cls, json_str: str) -> 'GameMetadata':
         """Deserialize from JSON string."""
-        data = json.loads(json_str)
+        data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
         return cls(**data)
 
     @classmethod
@@ -160,22 +190,21 @@ class GameMetadata:
         metadata = cls()
 
         # Parse cats (look for cat_1_, cat_2_, cat_3_)
-        for i in range(1, 10):  # Support up to 9 cats
-            name_key = f"cat_{i}_name"
+        cat_patterns = []
+        for name_key, points_key, patterns_key in _CAT_PARAM_KEYS:
             if name_key not in params:
                 break
             metadata.cat_names.append(params[name_key])
-            metadata.cat_points.append(int(params[f"cat_{i}_points"]))
-            patterns_str = params[f"cat_{i}_patterns"]
-            metadata.cat_patterns.append(patterns_str.split(","))
+            metadata.cat_points.append(int(params[points_key]))
+            cat_patterns.append(tuple(params[patterns_key].split(",")))
+        metadata.cat_patterns = tuple(cat_patterns)
 
         # Parse goals
-        for i in range(1, 10):  # Support up to 9 goals
-            name_key = f"goal_{i}_name"
+        for name_key, position_key in _GOAL_PARAM_KEYS:
             if name_key not in params:
                 break
             metadata.goal_names.append(params[name_key])
-            pos_str = params[f"goal_{i}_position"]
+            pos_str = params[position_key]
             metadata.goal_positions.append([int(p) for p in pos_str.split(",")])
 
         # Board
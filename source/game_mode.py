@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from itertools import permutations
 from typing import List, Tuple, Optional
 import random
 
@@ -12,6 +13,14 @@ from goal import create_goal_options, create_goals_from_selection
 from button import score_buttons, get_button_details
 
 
+# The 24 goal-selection actions are the same in every game; Actions are never
+# mutated after construction, so all games share these instances.
+_GOAL_SELECTION_ACTIONS = tuple(
+    Action(action_type="select_goals", selected_goal_indices=perm)
+    for perm in permutations(range(4), 3)
+)
+
+
 class GameMode(ABC):
     """Abstract base class for game modes."""
 
@@ -27,7 +36,7 @@ class GameMode(ABC):
         self.cats, _ = initialize_game_cats()
 
         # Goal selection: 4 options, player chooses 3
-        self.goal_options: List[type] = create_goal_options()  # 4 goal classes
+        self.goal_options: Tuple[type, ...] = create_goal_options()  # 4 goal classes
         self.goal_positions: List[Tuple[int, int, int]] = list(GOAL_POSITIONS)
         self.goals: List = []  # Empty until goal selection complete
 
@@ -71,13 +80,12 @@ class GameMode(ABC):
 
         elif self.turn_phase == TurnPhase.PLACE_TILE:
             empty_positions = self.player.grid.get_empty_positions()
-            for pos in empty_positions:
-                for hand_idx in range(len(self.player.tiles)):
-                    actions.append(Action(
-                        action_type="place_tile",
-                        position=pos,
-                        hand_index=hand_idx
-                    ))
+            hand_indices = range(len(self.player.tiles))
+            actions = [
+                Action(action_type="place_tile", position=pos, hand_index=hand_idx)
+                for pos in empty_positions
+                for hand_idx in hand_indices
+            ]
 
         elif self.turn_phase == TurnPhase.CHOOSE_MARKET:
             for market_idx in range(len(self.market.tiles)):
@@ -93,18 +101,10 @@ class GameMode(ABC):
         Enumerate all 24 possible goal selection arrangements.
 
         Player chooses 3 of 4 goals and assigns them to 3 positions.
-        P(4,3) = 4 * 3 * 2 = 24 arrangements.
+        P(4,3) = 4 * 3 * 2 = 24 arrangements. The Actions are shared module
+        constants; the list is fresh so callers may consume it.
         """
-        from itertools import permutations
-
-        actions = []
-        # Each permutation is a way to select 3 from 4 in a specific order
-        for perm in permutations(range(4), 3):
-            actions.append(Action(
-                action_type="select_goals",
-                selected_goal_indices=perm
-            ))
-        return actions
+        return list(_GOAL_SELECTION_ACTIONS)
 
     def get_combined_legal_actions(self) -> List[Action]:
         """Get list of combined place_and_choose actions.
@@ -112,42 +112,34 @@ class GameMode(ABC):
         Each action represents a full turn: placing a tile AND choosing from market.
         For the final turn (board fills after placement), market_index will be None.
         """
-        actions = []
-
         # Must be in PLACE_TILE phase to generate combined actions
         if self.turn_phase != TurnPhase.PLACE_TILE:
-            return actions
+            return []
 
         empty_positions = self.player.grid.get_empty_positions()
+        hand_indices = range(len(self.player.tiles))
 
-        for pos in empty_positions:
-            for hand_idx in range(len(self.player.tiles)):
-                # Check if placing here would end the game (only 1 empty position left)
-                is_final_turn = len(empty_positions) == 1
-
-                if is_final_turn:
-                    # Final turn: no market choice after placement
-                    actions.append(Action(
-                        action_type="place_and_choose",
-                        position=pos,
-                        hand_index=hand_idx,
-                        market_index=None
-                    ))
-                else:
-                    # Normal turn: include all market choices
-                    for market_idx in range(len(self.market.tiles)):
-                        actions.append(Action(
-                            action_type="place_and_choose",
-                            position=pos,
-                            hand_index=hand_idx,
-                            market_index=market_idx
-                        ))
-
-        return actions
+        # Placing the last empty position ends the game: no market choice after
+        if len(empty_positions) == 1:
+            market_indices = (None,)
+        else:
+            market_indices = range(len(self.market.tiles))
+
+        return [
+            Action(
+                action_type="place_and_choose",
+                position=pos,
+                hand_index=hand_idx,
+                market_index=market_idx
+            )
+            for pos in empty_positions
+            for hand_idx in hand_indices
+            for market_idx in market_indices
+        ]
 
     def is_game_over(self) -> bool:
         """Check if game has ended (all positions filled)."""
-        return len(self.player.grid.get_empty_positions()) == 0
+        return not self.player.grid.has_empty_positions()
 
     def get_final_score(self) -> int:
         """Calculate final score using cats, goals, and buttons."""
@@ -3,16 +3,30 @@ Game recording system for Calico MCTS analysis.
 
 Records complete games with decision info for step-by-step replay and analysis.
 """
+import io
 import json
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Any
 
-from tile import Tile, Color, Pattern
+try:
+    import orjson  # Optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+from tile import Tile, Color, Pattern, ALL_COLORS, ALL_PATTERNS, canonical_tile
 from game_state import Action, TurnPhase
 
+# Enum <-> name tables for TileRecord conversions (built once)
+_COLOR_NAMES = {color: color.name for color in ALL_COLORS}
+_PATTERN_NAMES = {pattern: pattern.name for pattern in ALL_PATTERNS}
+_TILES_BY_NAME = {
+    (color.name, pattern.name): canonical_tile(color, pattern)
+    for color in ALL_COLORS for pattern in ALL_PATTERNS
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class GoalSelectionCandidate:
     """A candidate goal selection considered by MCTS."""
     selected_indices: Tuple[int, int, int]  # Which 3 of 4 goals, in position order
@@ -35,7 +49,7 @@ class GoalSelectionCandidate:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GoalSelectionRecord:
     """Record of the goal selection decision at game start."""
     available_goals: List[str]  # 4 goal class names
@@ -58,7 +72,7 @@ class GoalSelectionRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateMove:
     """A candidate move considered by MCTS."""
     action_type: str
@@ -91,17 +105,14 @@ class CandidateMove:
 
     @classmethod
     def from_action(cls, action: Action, visits: int, avg_score: float) -> 'CandidateMove':
+        # Positional: called once per MCTS candidate when recording
         return cls(
-            action_type=action.action_type,
-            position=action.position,
-            hand_index=action.hand_index,
-            market_index=action.market_index,
-            visits=visits,
-            avg_score=avg_score
+            action.action_type, action.position, action.hand_index,
+            action.market_index, visits, avg_score,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TileRecord:
     """Serializable tile representation."""
     color: str
@@ -116,13 +127,13 @@ class TileRecord:
 
     @classmethod
     def from_tile(cls, tile: Tile) -> 'TileRecord':
-        return cls(color=tile.color.name, pattern=tile.pattern.name)
+        return cls(color=_COLOR_NAMES[tile.color], pattern=_PATTERN_NAMES[tile.pattern])
 
     def to_tile(self) -> Tile:
-        return Tile(Color[self.color], Pattern[self.pattern])
+        return _TILES_BY_NAME[self.color, self.pattern]
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionRecord:
     """Record of a single decision point in the game.
 
@@ -188,7 +199,7 @@ class DecisionRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CatRecord:
     """Record of a cat's configuration."""
     name: str
@@ -211,7 +222,7 @@ class CatRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GoalRecord:
     """Record of a goal's configuration."""
     name: str
@@ -225,7 +236,7 @@ class GoalRecord:
         return cls(name=data["name"], position=data["position"])
 
 
-@dataclass
+@dataclass(slots=True)
 class GameRecord:
     """Complete record of a game for replay and analysis."""
     timestamp: str
@@ -276,16 +287,33 @@ class GameRecord:
             format_version=data.get("format_version", "1.0")  # Default to 1.0 for old records
         )
 
-    def save(self, filepath: str):
-        """Save game record to JSON file."""
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+    def to_json_bytes(self) -> bytes:
+        """Encode the record as indented UTF-8 JSON."""
+        if orjson is not None:
+            return orjson.dumps(
+                self.to_dict(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False).encode()
+
+    def save(self, filepath):
+        """Save game record as JSON to a path or a text/binary file-like object."""
+        data = self.to_json_bytes()
+        if hasattr(filepath, 'write'):
+            filepath.write(data.decode() if isinstance(filepath, io.TextIOBase) else data)
+            return
+        with open(filepath, 'wb') as f:
+            f.write(data)
 
     @classmethod
-    def load(cls, filepath: str) -> 'GameRecord':
-        """Load game record from JSON file."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+    def load(cls, filepath) -> 'GameRecord':
+        """Load game record from a JSON path or a text/binary file-like object."""
+        if hasattr(filepath, 'read'):
+            raw = filepath.read()
+        else:
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return cls.from_dict(data)
 
 
@@ -391,6 +419,7 @@ class GameRecorder:
             simulated_discards: Market indices discarded by P2/P3/P4
         """
         state = self.game.get_game_state()
+        from_action = CandidateMove.from_action
 
         decision = DecisionRecord(
             turn_number=state.turn_number,
@@ -403,9 +432,7 @@ class GameRecorder:
             action_position=list(action.position) if action.position else None,
             action_hand_index=action.hand_index,
             action_market_index=action.market_index,
-            candidates=[
-                CandidateMove.from_action(a, v, s) for a, v, s in candidates
-            ],
+            candidates=[from_action(a, v, s) for a, v, s in candidates],
             tiles_drawn=[TileRecord.from_tile(t) for t in (tiles_drawn or [])],
             simulated_discards=simulated_discards or []
         )
@@ -12,7 +12,7 @@ class TurnPhase(Enum):
     GAME_OVER = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Immutable snapshot of game state for agents."""
     player_hand: List[Tile]
@@ -23,7 +23,7 @@ class GameState:
     tiles_remaining_in_bag: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Represents a player action.
 
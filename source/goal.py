@@ -1,10 +1,21 @@
 from abc import ABC, abstractmethod
+from itertools import combinations_with_replacement
 from typing import List, Tuple
-from collections import Counter
 
 from hex_grid import HexGrid
 
 
+# Count profiles via a packed histogram: each color/pattern value (1-6) owns a
+# 4-bit counter, so summing _NIBBLE[v] over a goal's six neighbors never
+# carries between counters. All 462 such histograms map to their count profile
+# (each distinct value's occurrences, largest first, e.g. (3, 2, 1)) up front.
+_NIBBLE = tuple(1 << (4 * v) for v in range(7))
+_PROFILE_BY_HISTOGRAM = {
+    sum(_NIBBLE[v] for v in combo): tuple(sorted(map(combo.count, set(combo)), reverse=True))
+    for combo in combinations_with_replacement(range(1, 7), 6)
+}
+
+
 class GoalTile(ABC):
     """Abstract base class for goal tiles."""
 
@@ -30,6 +41,31 @@ class GoalTile(ABC):
                 tiles.append(tile)
         return tiles
 
+    def _neighbor_profiles(self, grid: HexGrid):
+        """
+        (color profile, pattern profile) of the 6 neighbors, or None unless
+        all 6 are filled. Unrolled: goals always sit inside the board.
+        """
+        neighbors = grid.get_neighbors(*self.position)
+        if len(neighbors) != 6:
+            return None
+        get = grid.grid.get
+        p0, p1, p2, p3, p4, p5 = neighbors
+        t0, t1, t2, t3, t4, t5 = tiles = (get(p0), get(p1), get(p2), get(p3), get(p4), get(p5))
+        if None in tiles:
+            return None
+        nib = _NIBBLE
+        return (
+            _PROFILE_BY_HISTOGRAM[
+                nib[t0.color] + nib[t1.color] + nib[t2.color]
+                + nib[t3.color] + nib[t4.color] + nib[t5.color]
+            ],
+            _PROFILE_BY_HISTOGRAM[
+                nib[t0.pattern] + nib[t1.pattern] + nib[t2.pattern]
+                + nib[t3.pattern] + nib[t4.pattern] + nib[t5.pattern]
+            ],
+        )
+
     def __repr__(self):
         return f"GoalTile({self.name}, {self.position})"
 
@@ -46,14 +82,15 @@ class GoalAAA_BBB(GoalTile):
         super().__init__("AAA-BBB", position)
 
     def score(self, grid: HexGrid) -> int:
-        tiles = self.get_neighbor_tiles(grid)
+        profiles = self._neighbor_profiles(grid)
 
         # Need exactly 6 neighbors filled
-        if len(tiles) != 6:
+        if profiles is None:
             return 0
 
-        color_met = self._check_3_3_condition([t.color for t in tiles])
-        pattern_met = self._check_3_3_condition([t.pattern for t in tiles])
+        color_profile, pattern_profile = profiles
+        color_met = color_profile == (3, 3)
+        pattern_met = pattern_profile == (3, 3)
 
         if color_met and pattern_met:
             return 13
@@ -61,12 +98,6 @@ class GoalAAA_BBB(GoalTile):
             return 8
         return 0
 
-    def _check_3_3_condition(self, values: list) -> bool:
-        """Check if values have exactly 3 of one type and 3 of another."""
-        counts = Counter(values)
-        count_values = sorted(counts.values(), reverse=True)
-        return count_values == [3, 3]
-
 
 class GoalAA_BB_CC(GoalTile):
     """
@@ -80,14 +111,15 @@ class GoalAA_BB_CC(GoalTile):
         super().__init__("AA-BB-CC", position)
 
     def score(self, grid: HexGrid) -> int:
-        tiles = self.get_neighbor_tiles(grid)
+        profiles = self._neighbor_profiles(grid)
 
         # Need exactly 6 neighbors filled
-        if len(tiles) != 6:
+        if profiles is None:
             return 0
 
-        color_met = self._check_2_2_2_condition([t.color for t in tiles])
-        pattern_met = self._check_2_2_2_condition([t.pattern for t in tiles])
+        color_profile, pattern_profile = profiles
+        color_met = color_profile == (2, 2, 2)
+        pattern_met = pattern_profile == (2, 2, 2)
 
         if color_met and pattern_met:
             return 11
@@ -95,12 +127,6 @@ class GoalAA_BB_CC(GoalTile):
             return 7
         return 0
 
-    def _check_2_2_2_condition(self, values: list) -> bool:
-        """Check if values have exactly 2 each of 3 different types."""
-        counts = Counter(values)
-        count_values = sorted(counts.values(), reverse=True)
-        return count_values == [2, 2, 2]
-
 
 class GoalAllUnique(GoalTile):
     """
@@ -114,17 +140,15 @@ class GoalAllUnique(GoalTile):
         super().__init__("All Unique", position)
 
     def score(self, grid: HexGrid) -> int:
-        tiles = self.get_neighbor_tiles(grid)
+        profiles = self._neighbor_profiles(grid)
 
         # Need exactly 6 neighbors filled
-        if len(tiles) != 6:
+        if profiles is None:
             return 0
 
-        colors = [t.color for t in tiles]
-        patterns = [t.pattern for t in tiles]
-
-        color_met = len(set(colors)) == 6
-        pattern_met = len(set(patterns)) == 6
+        color_profile, pattern_profile = profiles
+        color_met = color_profile == (1, 1, 1, 1, 1, 1)
+        pattern_met = pattern_profile == (1, 1, 1, 1, 1, 1)
 
         if color_met and pattern_met:
             return 15
@@ -145,14 +169,15 @@ class GoalAAAA_BB(GoalTile):
         super().__init__("AAAA-BB", position)
 
     def score(self, grid: HexGrid) -> int:
-        tiles = self.get_neighbor_tiles(grid)
+        profiles = self._neighbor_profiles(grid)
 
         # Need exactly 6 neighbors filled
-        if len(tiles) != 6:
+        if profiles is None:
             return 0
 
-        color_met = self._check_4_2_condition([t.color for t in tiles])
-        pattern_met = self._check_4_2_condition([t.pattern for t in tiles])
+        color_profile, pattern_profile = profiles
+        color_met = color_profile == (4, 2)
+        pattern_met = pattern_profile == (4, 2)
 
         if color_met and pattern_met:
             return 14
@@ -160,12 +185,6 @@ class GoalAAAA_BB(GoalTile):
             return 7
         return 0
 
-    def _check_4_2_condition(self, values: list) -> bool:
-        """Check if values have exactly 4 of one type and 2 of another."""
-        counts = Counter(values)
-        count_values = sorted(counts.values(), reverse=True)
-        return count_values == [4, 2]
-
 
 class GoalAA_BB_C_D(GoalTile):
     """
@@ -179,14 +198,15 @@ class GoalAA_BB_C_D(GoalTile):
         super().__init__("AA-BB-C-D", position)
 
     def score(self, grid: HexGrid) -> int:
-        tiles = self.get_neighbor_tiles(grid)
+        profiles = self._neighbor_profiles(grid)
 
         # Need exactly 6 neighbors filled
-        if len(tiles) != 6:
+        if profiles is None:
             return 0
 
-        color_met = self._check_2_2_1_1_condition([t.color for t in tiles])
-        pattern_met = self._check_2_2_1_1_condition([t.pattern for t in tiles])
+        color_profile, pattern_profile = profiles
+        color_met = color_profile == (2, 2, 1, 1)
+        pattern_met = pattern_profile == (2, 2, 1, 1)
 
         if color_met and pattern_met:
             return 7
@@ -194,12 +214,6 @@ class GoalAA_BB_C_D(GoalTile):
             return 5
         return 0
 
-    def _check_2_2_1_1_condition(self, values: list) -> bool:
-        """Check if values have 2 each of 2 types and 1 each of 2 other types."""
-        counts = Counter(values)
-        count_values = sorted(counts.values(), reverse=True)
-        return count_values == [2, 2, 1, 1]
-
 
 class GoalAAA_BB_C(GoalTile):
     """
@@ -213,14 +227,15 @@ class GoalAAA_BB_C(GoalTile):
         super().__init__("AAA-BB-C", position)
 
     def score(self, grid: HexGrid) -> int:
-        tiles = self.get_neighbor_tiles(grid)
+        profiles = self._neighbor_profiles(grid)
 
         # Need exactly 6 neighbors filled
-        if len(tiles) != 6:
+        if profiles is None:
             return 0
 
-        color_met = self._check_3_2_1_condition([t.color for t in tiles])
-        pattern_met = self._check_3_2_1_condition([t.pattern for t in tiles])
+        color_profile, pattern_profile = profiles
+        color_met = color_profile == (3, 2, 1)
+        pattern_met = pattern_profile == (3, 2, 1)
 
         if color_met and pattern_met:
             return 11
@@ -228,12 +243,6 @@ class GoalAAA_BB_C(GoalTile):
             return 7
         return 0
 
-    def _check_3_2_1_condition(self, values: list) -> bool:
-        """Check if values have 3 of one type, 2 of another, and 1 of a third."""
-        counts = Counter(values)
-        count_values = sorted(counts.values(), reverse=True)
-        return count_values == [3, 2, 1]
-
 
 # All available goal tile classes
 ALL_GOAL_CLASSES = [
@@ -272,7 +281,7 @@ def create_random_goals() -> List[GoalTile]:
     return goals
 
 
-def create_goal_options() -> List[type]:
+def create_goal_options() -> Tuple[type, ...]:
     """
     Create 4 randomly selected goal tile classes for the selection phase.
 
@@ -280,10 +289,11 @@ def create_goal_options() -> List[type]:
     and must choose 3 to place on the board.
 
     Returns:
-        List of 4 GoalTile classes (not instantiated).
+        Tuple of 4 distinct GoalTile classes (not instantiated). Immutable,
+        since game copies share it.
     """
     import random
-    return random.sample(ALL_GOAL_CLASSES, 4)
+    return tuple(random.sample(ALL_GOAL_CLASSES, 4))
 
 
 def create_goals_from_selection(
@@ -13,6 +13,7 @@ from collections import Counter
 from functools import lru_cache
 
 from hex_grid import HexGrid, Pattern, Color
+from tile import ALL_COLORS
 from cat import Cat, CatMillie, CatLeo, CatRumi, CatTecolote
 from button import score_buttons, count_buttons_by_color
 
@@ -658,7 +659,7 @@ def evaluate_buttons_with_reasons(grid: HexGrid, config: HeuristicConfig = None)
     # Rainbow potential
     colors_with_buttons_count = sum(1 for count in button_counts.values() if count >= 1)
     colors_with_potential = colors_with_buttons_count
-    for color in Color:
+    for color in ALL_COLORS:
         if button_counts.get(color, 0) == 0 and color_pairs.get(color, 0) > 0:
             colors_with_potential += 1
 
@@ -1151,7 +1152,7 @@ def evaluate_buttons(grid: HexGrid, config: HeuristicConfig = None) -> float:
 
     # Count colors with button potential (completed OR have pairs)
     colors_with_potential = colors_with_buttons
-    for color in Color:
+    for color in ALL_COLORS:
         if button_counts.get(color, 0) == 0 and color_pairs.get(color, 0) > 0:
             colors_with_potential += 1
 
@@ -1214,12 +1215,13 @@ def count_all_color_pairs(grid: HexGrid) -> Dict[Color, int]:
 
     Returns dict mapping Color -> number of pairs for that color.
     """
-    # Track pairs per color
-    pairs_by_color = {color: 0 for color in Color}
-    neighbors_count = {color: {} for color in Color}  # pos -> neighbor count
+    # Positions with exactly 1 same-color neighbor, accumulated per color
+    # directly instead of storing every position's neighbor count first
+    singles_by_color = {color: 0 for color in ALL_COLORS}
+    grid_dict = grid.grid  # Local reference for speed
 
     for pos in grid.all_positions:
-        tile = grid.grid.get(pos)
+        tile = grid_dict.get(pos)
         if tile is None:
             continue
 
@@ -1227,15 +1229,12 @@ def count_all_color_pairs(grid: HexGrid) -> Dict[Color, int]:
         same_color_neighbors = 0
 
         for neighbor_pos in grid.get_neighbors(*pos):
-            neighbor = grid.grid.get(neighbor_pos)
+            neighbor = grid_dict.get(neighbor_pos)
             if neighbor is not None and neighbor.color == color:
                 same_color_neighbors += 1
 
-        neighbors_count[color][pos] = same_color_neighbors
-
-    # Count pairs: positions with exactly 1 same-color neighbor
-    for color in Color:
-        pair_count = sum(1 for count in neighbors_count[color].values() if count == 1)
-        pairs_by_color[color] = pair_count // 2  # Each pair counted twice
+        if same_color_neighbors == 1:
+            singles_by_color[color] += 1
 
-    return pairs_by_color
+    # Each pair is counted once from each end
+    return {color: count // 2 for color, count in singles_by_color.items()}
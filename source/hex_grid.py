@@ -1,4 +1,4 @@
-from tile import Tile, Color, Pattern
+from tile import Tile, Color, Pattern, canonical_tile
 
 # Hex grid neighbor directions (constant)
 _HEX_DIRECTIONS = (
@@ -14,15 +14,15 @@ _LINE_DIRECTIONS = (
 )
 
 
-def _build_all_grid_positions():
-    """Build the set of all valid grid positions (matches HexGrid.initialize_grid)."""
-    positions = set()
+def _build_grid_layout():
+    """Build all valid grid positions in board order (matches HexGrid.initialize_grid)."""
+    positions = []
     # Main hex area
     for q in range(-3, 4):
         for r in range(-3, 4):
             s = -q - r
             if abs(s) <= 3:
-                positions.add((q, r, s))
+                positions.append((q, r, s))
     # Extra coordinates
     extras = [
         (-1, 4), (-2, 4), (-3, 4),
@@ -31,8 +31,20 @@ def _build_all_grid_positions():
         (2, -4), (1, -4),
     ]
     for q, r in extras:
-        positions.add((q, r, -q - r))
-    return positions
+        positions.append((q, r, -q - r))
+    return tuple(positions)
+
+
+def _compute_neighbor_cache(positions):
+    """Map each position to the tuple of its neighbors that are also in positions."""
+    return {
+        (q, r, s): tuple(
+            (q + dq, r + dr, s + ds)
+            for dq, dr, ds in _HEX_DIRECTIONS
+            if (q + dq, r + dr, s + ds) in positions
+        )
+        for q, r, s in positions
+    }
 
 
 def _enumerate_lines(positions, length):
@@ -58,31 +70,40 @@ def _enumerate_lines(positions, length):
 
 
 # Pre-compute all valid lines at module load time
-_ALL_POSITIONS = _build_all_grid_positions()
+_GRID_LAYOUT = _build_grid_layout()
+_ALL_POSITIONS = set(_GRID_LAYOUT)
 ALL_3_LINES = _enumerate_lines(_ALL_POSITIONS, 3)  # For Rumi (5 pts)
 ALL_4_LINES = _enumerate_lines(_ALL_POSITIONS, 4)  # For future cat
 ALL_5_LINES = _enumerate_lines(_ALL_POSITIONS, 5)  # For Leo (11 pts)
 
+# Shared, never-mutated templates: every HexGrid starts from the same empty
+# layout, and neighbor caches depend only on which positions exist. Grids
+# copy the layout dict but share neighbor caches, one per distinct layout.
+_EMPTY_GRID = dict.fromkeys(_GRID_LAYOUT)
+_BASE_NEIGHBOR_CACHE = _compute_neighbor_cache(_EMPTY_GRID)
+_NEIGHBOR_CACHE_BY_LAYOUT = {frozenset(_GRID_LAYOUT): _BASE_NEIGHBOR_CACHE}
+
 class HexGrid:
-    __slots__ = ('grid', 'goal_positions', '_neighbor_cache', '_all_positions_cache')
+    __slots__ = ('grid', 'goal_positions', '_neighbor_cache', '_all_positions_cache', '_empty')
 
     def __init__(self):
-        self.grid = {}
+        self.grid = _EMPTY_GRID.copy()
+        # Empty positions in grid order, kept in step with self.grid
+        self._empty = _EMPTY_GRID.copy()
         self.goal_positions = set()  # Positions where goals are placed (cannot place tiles)
-        self._neighbor_cache = {}
+        self._neighbor_cache = _BASE_NEIGHBOR_CACHE  # Shared, never mutated
         self._all_positions_cache = None
-        self.initialize_grid()
-        self._build_neighbor_cache()
 
     def _build_neighbor_cache(self):
-        """Pre-compute neighbors for all positions (called after grid is built)."""
-        for pos in self.grid:
-            q, r, s = pos
-            self._neighbor_cache[pos] = tuple(
-                (q + dq, r + dr, s + ds)
-                for dq, dr, ds in _HEX_DIRECTIONS
-                if (q + dq, r + dr, s + ds) in self.grid
-            )
+        """Look up (or compute once) the shared neighbor cache for the current layout."""
+        layout = frozenset(self.grid)
+        cache = _NEIGHBOR_CACHE_BY_LAYOUT.get(layout)
+        if cache is None:
+            # Removed positions (e.g. goals) keep their full-board neighbors
+            cache = dict(_BASE_NEIGHBOR_CACHE)
+            cache.update(_compute_neighbor_cache(self.grid))
+            _NEIGHBOR_CACHE_BY_LAYOUT[layout] = cache
+        self._neighbor_cache = cache
         self._all_positions_cache = None  # Invalidate cache
 
     @property
@@ -92,26 +113,19 @@ class HexGrid:
             self._all_positions_cache = tuple(self.grid.keys())
         return self._all_positions_cache
 
+    def _sync_empty(self):
+        """Rebuild the empty-position index from the grid (after bulk changes)."""
+        self._empty = {pos: None for pos, tile in self.grid.items() if tile is None}
+
     def add_hex(self, qr):
         q, r = qr
         s = -q - r
         self.grid[(q, r, s)] = None
+        self._sync_empty()
 
     def initialize_grid(self):
-        for q in range(-3, 4):
-            for r in range(-3, 4):
-                s = -q - r
-                if abs(s) <= 3:
-                    self.grid[(q, r, s)] = None
-
-        extra_coordinates = [
-            (-1,4), (-2, 4), (-3,4),
-            (4,-1), (4,-2),
-            (-4,3), (-4,2), (-4,1),
-            (2,-4), (1,-4),
-            ]
-        for coord in extra_coordinates:
-            self.add_hex(coord)
+        self.grid.update(_EMPTY_GRID)
+        self._sync_empty()
 
     def get_neighbors(self, q, r, s):
         """Return cached neighbors for position (O(1) lookup)."""
@@ -120,22 +134,45 @@ class HexGrid:
     def is_valid_position(self, q, r, s):
         return (q, r, s) in self.grid and -4 <= q <= 4 and -4 <= r <= 4 and -4 <= s <= 4
 
+    def _put(self, pos, tile):
+        self.grid[pos] = tile
+        if tile is not None:
+            self._empty.pop(pos, None)
+        elif pos not in self._empty:
+            self._sync_empty()  # Re-emptied: rebuild to keep grid order
+
     def set_tile(self, q, r, s, tile):
         if self.is_valid_position(q, r, s):
-            self.grid[(q, r, s)] = tile
+            self._put((q, r, s), tile)
         else:
             raise ValueError(f"Invalid grid position: ({q}, {r}, {s})")
 
+    def set_tiles(self, entries):
+        """Place several tiles given as (q, r, s, tile) tuples."""
+        grid = self.grid
+        for q, r, s, tile in entries:
+            if (q, r, s) not in grid:
+                raise ValueError(f"Invalid grid position: ({q}, {r}, {s})")
+            self._put((q, r, s), tile)
+
     def get_tile(self, q, r, s):
         if self.is_valid_position(q, r, s):
             return self.grid[(q, r, s)]
         else:
             raise ValueError(f"Invalid grid position: ({q}, {r}, {s})")
 
+    def clear(self):
+        """Remove all placed tiles, keeping the layout and goal positions."""
+        grid = self.grid
+        for pos in grid:
+            grid[pos] = None
+        self._empty = dict.fromkeys(grid)
+
     def initialize_from_config(self, config):
-        for coord, (color, pattern) in config.items():
-            q, r, s = coord
-            self.set_tile(q, r, s, Tile(color, pattern))
+        self.set_tiles(
+            (q, r, s, canonical_tile(color, pattern))
+            for (q, r, s), (color, pattern) in config.items()
+        )
 
     def set_goal_positions(self, positions):
         """Set the goal positions where tiles cannot be placed."""
@@ -144,6 +181,7 @@ class HexGrid:
         for pos in self.goal_positions:
             if pos in self.grid:
                 del self.grid[pos]
+                self._empty.pop(pos, None)
         # Rebuild neighbor cache after grid modification
         self._build_neighbor_cache()
 
@@ -170,8 +208,12 @@ class HexGrid:
         return result
 
     def get_empty_positions(self):
-        """Return list of positions with no tile placed."""
-        return [pos for pos, tile in self.grid.items() if tile is None]
+        """Return list of positions with no tile placed, in grid order."""
+        return list(self._empty)
+
+    def has_empty_positions(self):
+        """True if any position still has no tile (O(1))."""
+        return bool(self._empty)
 
     def is_position_empty(self, q, r, s):
         """Check if a specific position is empty and valid for placement."""
@@ -186,4 +228,5 @@ class HexGrid:
         new_grid.goal_positions = self.goal_positions  # Share immutable set
         new_grid._neighbor_cache = self._neighbor_cache  # Share cache
         new_grid._all_positions_cache = self._all_positions_cache  # Share cache
+        new_grid._empty = self._empty.copy()
         return new_grid
\ No newline at end of file
@@ -4,6 +4,7 @@ Monte Carlo Tree Search agent for Calico.
 Uses UCT (Upper Confidence Bounds for Trees) for action selection.
 Supports hybrid evaluation: heuristic for early game, full rollouts for late game.
 """
+import heapq
 import math
 import random
 from dataclasses import dataclass, field
@@ -16,6 +17,15 @@ if TYPE_CHECKING:
     from heuristic import HeuristicConfig, ScoreBreakdown
 
 
+def _top_children_by_visits(node: 'MCTSNode', n: int) -> List['MCTSNode']:
+    """Return the n most-visited children, most-visited first.
+
+    heapq.nlargest is O(children * log n) and matches
+    sorted(..., reverse=True)[:n] ordering, ties included.
+    """
+    return heapq.nlargest(n, node.children, key=lambda c: c.visits)
+
+
 @dataclass
 class CandidateInfo:
     """Full analysis of a candidate move for engine suggestion display.
@@ -102,13 +112,14 @@ class MCTSNode:
     def __post_init__(self):
         """Initialize untried actions from state if not provided."""
         if not self.untried_actions and not self.is_terminal:
-            # Goal selection phase always uses get_legal_actions()
+            # Goal selection phase always uses get_legal_actions(), which may
+            # return a shared tuple; expand() pops, so keep a private list
             if self.state.turn_phase == TurnPhase.GOAL_SELECTION:
-                self.untried_actions = self.state.get_legal_actions()
+                self.untried_actions = list(self.state.get_legal_actions())
             elif self.use_combined_actions:
                 self.untried_actions = self.state.get_combined_legal_actions()
             else:
-                self.untried_actions = self.state.get_legal_actions()
+                self.untried_actions = list(self.state.get_legal_actions())
 
     @property
     def is_fully_expanded(self) -> bool:
@@ -120,25 +131,45 @@ class MCTSNode:
         """True if game is over at this node."""
         return self.state.is_game_over()
 
-    def ucb1_score(self, exploration_constant: float) -> float:
+    def ucb1_score(self, exploration_constant: float,
+                   log_parent_visits: Optional[float] = None) -> float:
         """
         Calculate UCB1 score for node selection.
 
         UCB1 = exploitation + exploration
              = (avg_score) + C * sqrt(ln(parent_visits) / visits)
+
+        Callers scoring many siblings can pass ln(parent_visits) in
+        log_parent_visits so it is computed once.
         """
         if self.visits == 0:
             return float('inf')
 
+        if log_parent_visits is None:
+            log_parent_visits = math.log(self.parent.visits)
         exploitation = self.total_score / self.visits
         exploration = exploration_constant * math.sqrt(
-            math.log(self.parent.visits) / self.visits
+            log_parent_visits / self.visits
         )
         return exploitation + exploration
 
     def best_child(self, exploration_constant: float) -> 'MCTSNode':
-        """Return child with highest UCB1 score."""
-        return max(self.children, key=lambda c: c.ucb1_score(exploration_constant))
+        """Return child with highest UCB1 score.
+
+        Raises ValueError if the node has no children.
+        """
+        if not self.children:
+            raise ValueError("best_child() called on a node with no children")
+        # Unvisited children score infinity; take the first before ln(visits),
+        # which is undefined while this node itself is unvisited
+        for child in self.children:
+            if child.visits == 0:
+                return child
+        log_visits = math.log(self.visits)
+        return max(
+            self.children,
+            key=lambda c: c.ucb1_score(exploration_constant, log_visits),
+        )
 
     def expand(self) -> 'MCTSNode':
         """
@@ -325,13 +356,13 @@ class MCTSAgent:
                 return actions[0], [(actions[0], 0, 0.0)]
             return None, []
 
-        # Sort children by visits (robust selection)
-        sorted_children = sorted(root.children, key=lambda c: c.visits, reverse=True)
-        best_child = sorted_children[0]
+        # Rank children by visits (robust selection)
+        top_children = _top_children_by_visits(root, max(n_candidates, 1))
+        best_child = top_children[0]
 
         # Extract top candidates
         candidates = []
-        for child in sorted_children[:n_candidates]:
+        for child in top_children[:n_candidates]:
             avg_score = child.total_score / child.visits if child.visits > 0 else 0.0
             candidates.append((child.action, child.visits, avg_score))
 
@@ -386,13 +417,13 @@ class MCTSAgent:
                 return actions[0], [CandidateInfo(actions[0], 0, 0.0, empty_breakdown)]
             return None, []
 
-        # Sort children by visits (robust selection)
-        sorted_children = sorted(root.children, key=lambda c: c.visits, reverse=True)
-        best_child = sorted_children[0]
+        # Rank children by visits (robust selection)
+        top_children = _top_children_by_visits(root, max(n_candidates, 1))
+        best_child = top_children[0]
 
         # Extract top candidates with detailed breakdowns
         candidates = []
-        for child in sorted_children[:n_candidates]:
+        for child in top_children[:n_candidates]:
             avg_score = child.total_score / child.visits if child.visits > 0 else 0.0
 
             # Get detailed breakdown for this move's resulting position
@@ -565,8 +596,7 @@ class MCTSAgent:
         print(f"  Children explored: {len(root.children)}")
         print(f"  Top 5 actions by visits:")
 
-        sorted_children = sorted(root.children, key=lambda c: c.visits, reverse=True)
-        for child in sorted_children[:5]:
+        for child in _top_children_by_visits(root, 5):
             avg = child.total_score / child.visits if child.visits > 0 else 0
             action = child.action
             if action.action_type == "place_and_choose":
@@ -1,5 +1,5 @@
 import copy
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import random
 
 from game_mode import GameMode
@@ -14,11 +14,17 @@ class SimulationMode(GameMode):
     - Legal action enumeration
     - Action application
     - Game state copying for lookahead
+
+    get_legal_actions() and get_state_hash() are cached until the next
+    apply_action(). Code that edits the grid, hand or market directly must
+    call invalidate_caches() afterwards; copy() starts with empty caches.
     """
 
     def __init__(self, board_config=None):
         super().__init__(board_config)
         self._action_history: List[Action] = []
+        self._legal_actions_cache: Optional[Tuple[Action, ...]] = None
+        self._state_hash_cache: Optional[str] = None
 
     @classmethod
     def from_game_mode(cls, game: 'GameMode') -> 'SimulationMode':
@@ -58,6 +64,8 @@ class SimulationMode(GameMode):
 
         # Initialize empty action history
         sim._action_history = []
+        sim._legal_actions_cache = None
+        sim._state_hash_cache = None
 
         return sim
 
@@ -104,7 +112,7 @@ class SimulationMode(GameMode):
         new_game.cats = self.cats
 
         # Goal selection state
-        new_game.goal_options = self.goal_options  # Share immutable class list
+        new_game.goal_options = self.goal_options  # Share immutable class tuple
         new_game.goal_positions = self.goal_positions  # Share position list
         new_game.goals = self.goals  # Empty list or instantiated goals
         new_game._tiles_initialized = self._tiles_initialized
@@ -118,6 +126,8 @@ class SimulationMode(GameMode):
 
         # Copy action history (list of immutable Action dataclasses)
         new_game._action_history = self._action_history.copy()
+        new_game._legal_actions_cache = None
+        new_game._state_hash_cache = None
 
         # Chance node sampling - shuffle for honest simulation
         # This is important for goal selection: the agent doesn't know
@@ -130,13 +140,31 @@ class SimulationMode(GameMode):
         """Return history of all actions taken."""
         return list(self._action_history)
 
+    def get_legal_actions(self) -> Tuple[Action, ...]:
+        """
+        Override to reuse the enumeration until the next apply_action()
+        or invalidate_caches().
+
+        Returns the cached tuple itself; callers that consume actions
+        (e.g. MCTSNode) take their own list copy.
+        """
+        if self._legal_actions_cache is None:
+            self._legal_actions_cache = tuple(super().get_legal_actions())
+        return self._legal_actions_cache
+
     def apply_action(self, action: Action) -> bool:
         """Override to track action history."""
         success = super().apply_action(action)
         if success:
             self._action_history.append(action)
+            self.invalidate_caches()
         return success
 
+    def invalidate_caches(self):
+        """Drop cached legal actions and state hash after a direct state edit."""
+        self._legal_actions_cache = None
+        self._state_hash_cache = None
+
     # --- Convenience Methods for MCMC Agent ---
 
     def play_random_game(self, use_combined_actions: bool = True) -> int:
@@ -147,28 +175,32 @@ class SimulationMode(GameMode):
         Args:
             use_combined_actions: If True, use combined place_and_choose actions
         """
-        while not self.is_game_over():
-            # Goal selection phase uses regular get_legal_actions()
-            if self.turn_phase == TurnPhase.GOAL_SELECTION:
-                actions = self.get_legal_actions()
-            elif use_combined_actions:
+        # apply_action() sets GAME_OVER once the board fills, so the phase is
+        # enough to drive the loop without rescanning for empty positions
+        choice = random.choice
+        while self.turn_phase != TurnPhase.GAME_OVER:
+            # Goal selection (and market, when not combined) use get_legal_actions()
+            if use_combined_actions and self.turn_phase == TurnPhase.PLACE_TILE:
                 actions = self.get_combined_legal_actions()
             else:
                 actions = self.get_legal_actions()
             if not actions:
                 break
-            action = random.choice(actions)
-            self.apply_action(action)
+            self.apply_action(choice(actions))
         return self.get_final_score()
 
     def get_state_hash(self) -> str:
         """
         Return hashable representation of current state.
-        Useful for MCMC state deduplication.
+        Useful for MCMC state deduplication. Cached until the next apply_action()
+        or invalidate_caches().
         """
+        if self._state_hash_cache is not None:
+            return self._state_hash_cache
         state = self.get_game_state()
         # Create deterministic hash from state
         hand_str = ','.join(f"{t.color.value}{t.pattern.value}" for t in state.player_hand)
         market_str = ','.join(f"{t.color.value}{t.pattern.value}" for t in state.market_tiles)
         grid_str = ','.join(str(pos) for pos in sorted(state.empty_positions))
-        return f"{state.turn_phase.value}|{hand_str}|{market_str}|{grid_str}"
+        self._state_hash_cache = f"{state.turn_phase.value}|{hand_str}|{market_str}|{grid_str}"
+        return self._state_hash_cache
@@ -1,6 +1,10 @@
-from enum import Enum
+from enum import IntEnum
 
-class Color(Enum):
+# IntEnum so members hash and compare as plain ints (C fast path in the many
+# dicts/sets keyed by color or pattern). Color.PINK == Pattern.DOTS, so never
+# mix colors and patterns in one container. On 3.11+ str()/f-strings of a
+# member give the number ("2", not "Color.BLUE"); use .name for display text.
+class Color(IntEnum):
     PINK = 1
     BLUE = 2
     GREEN = 3
@@ -8,7 +12,7 @@ class Color(Enum):
     PURPLE = 5
     TEAL = 6
 
-class Pattern(Enum):
+class Pattern(IntEnum):
     DOTS = 1
     STRIPES = 2
     FLOWERS = 3
@@ -16,12 +20,45 @@ class Pattern(Enum):
     CLUBS = 5
     SWIRLS = 6
 
+# Enum iteration goes through the metaclass on every loop; hot paths iterate
+# these cached tuples instead.
+ALL_COLORS = tuple(Color)
+ALL_PATTERNS = tuple(Pattern)
+
+
+# One shared instance per (color, pattern), filled below. Tiles are never
+# mutated after construction, so Tile(...) hands back the shared instance and
+# identity comparison doubles as value equality. Lookups such as
+# canonical_tile() and game_record's _TILES_BY_NAME rely on that, so copies and
+# unpickled tiles must keep resolving through __reduce__ below.
+_TILE_CACHE = {}
+
+
 class Tile:
     __slots__ = ('color', 'pattern')
 
-    def __init__(self, color: Color, pattern: Pattern):
-        self.color = color
-        self.pattern = pattern
+    def __new__(cls, color: Color, pattern: Pattern):
+        tile = _TILE_CACHE.get((color, pattern))
+        if tile is None:
+            tile = object.__new__(cls)
+            tile.color = color
+            tile.pattern = pattern
+        return tile
+
+    def __reduce__(self):
+        # Copies and pickles resolve back to the shared instance
+        return (Tile, (self.color, self.pattern))
 
     def __repr__(self):
-        return f"Tile({self.color.name}, {self.pattern.name})"
\ No newline at end of file
+        return f"Tile({self.color.name}, {self.pattern.name})"
+
+
+_TILE_CACHE.update(
+    ((color, pattern), Tile(color, pattern))
+    for color in ALL_COLORS for pattern in ALL_PATTERNS
+)
+
+
+def canonical_tile(color: Color, pattern: Pattern) -> Tile:
+    """Return the shared Tile instance for a color/pattern combination."""
+    return _TILE_CACHE[(color, pattern)]
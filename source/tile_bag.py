@@ -1,5 +1,5 @@
 import random
-from tile import Tile, Color, Pattern
+from tile import ALL_COLORS, ALL_PATTERNS, canonical_tile
 
 class TileBag:
     __slots__ = ('tiles',)
@@ -10,10 +10,11 @@ class TileBag:
         self.shuffle()
 
     def fill_bag(self):
-        for color in Color:
-            for pattern in Pattern:
+        for color in ALL_COLORS:
+            for pattern in ALL_PATTERNS:
+                tile = canonical_tile(color, pattern)
                 for _ in range(3):  # 3 of each combination
-                    self.tiles.append(Tile(color, pattern))
+                    self.tiles.append(tile)
 
     def shuffle(self):
         random.shuffle(self.tiles)
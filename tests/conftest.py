@@ -0,0 +1,41 @@
+import os
+import random
+
+import pytest
+
+# sys.path is set once via `pythonpath` in pyproject.toml.
+from simulation_mode import SimulationMode
+from board_configurations import BOARD_1
+
+
+@pytest.fixture(autouse=True, scope="session")
+def seed_random():
+    """Seed the global RNG once so random game setups are reproducible."""
+    random.seed(0xCA1C0)
+
+
+@pytest.fixture(scope="session")
+def pristine_game():
+    """One BOARD_1 game still in goal selection; only ever copied, never mutated."""
+    return SimulationMode(BOARD_1)
+
+
+@pytest.fixture(scope="module")
+def fresh_game():
+    """One BOARD_1 game per module, past goal selection and ready to place."""
+    game = SimulationMode(BOARD_1)
+    game.apply_action(game.get_legal_actions()[0])
+    return game
+
+
+@pytest.fixture
+def game(fresh_game):
+    """A private copy of fresh_game that the test is free to mutate."""
+    return fresh_game.copy()
+
+
+@pytest.fixture(scope="session")
+def mcts_test_iters():
+    """MCTS iterations for tests that only check action types and ordering, not
+    move quality. Override with the MCTS_TEST_ITERS environment variable."""
+    return int(os.environ.get("MCTS_TEST_ITERS", "10"))
@@ -1,19 +1,47 @@
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import functools
+import random
 
 import pytest
-from source.hex_grid import HexGrid, Color, Pattern
-from source.tile import Tile
+from source.hex_grid import HexGrid, Color, Pattern, canonical_tile
 from source.cat import (
     initialize_game_cats, CatMillie, CatLeo, CatRumi, CatTecolote,
     BUCKET_1, BUCKET_2, BUCKET_3
 )
 
+@functools.lru_cache(maxsize=1)
+def _cached_game_cats():
+    """One initialize_game_cats() result for tests that only inspect its shape.
+
+    TestBucketSelection calls initialize_game_cats() directly because it
+    exercises the random selection itself.
+    """
+    return initialize_game_cats()
+
+
+@pytest.fixture(scope="module")
+def module_grid():
+    """One HexGrid shared by every test in this module."""
+    return HexGrid()
+
+
+@pytest.fixture
+def grid(module_grid):
+    """The shared HexGrid, cleared before each test."""
+    module_grid.clear()
+    return module_grid
+
+
+@pytest.fixture
+def restore_random_state():
+    """Put the global RNG back after a test that reseeds it."""
+    state = random.getstate()
+    yield
+    random.setstate(state)
+
+
 @pytest.fixture
-def game_setup():
-    cats, remaining_patterns = initialize_game_cats()
-    grid = HexGrid()
+def game_setup(grid):
+    cats, remaining_patterns = _cached_game_cats()
     return cats, remaining_patterns, grid
 
 def test_game_setup(game_setup):
@@ -33,265 +61,164 @@ def test_game_setup(game_setup):
     # Test that all patterns are accounted for
     assert set(all_cat_patterns + remaining_patterns) == set(Pattern)
 
+
+# Cat fixtures below all prefer DOTS and STRIPES; MATCH is the first of
+# those and OTHER is a pattern none of them want.
+MATCH = Pattern.DOTS
+OTHER = Pattern.FLOWERS
+
+
+def place(grid, placements):
+    """Place (q, r, s, color, pattern) entries on the grid."""
+    grid.set_tiles((q, r, s, canonical_tile(color, pattern))
+                   for q, r, s, color, pattern in placements)
+
+
 @pytest.fixture
-def millie_setup():
+def millie_setup(grid):
     """Create a Millie cat with known patterns for testing."""
     millie = CatMillie()
     millie.patterns = (Pattern.DOTS, Pattern.STRIPES)
-    grid = HexGrid()
     return millie, grid
 
 
-def test_millie_condition(millie_setup):
+@pytest.mark.parametrize("placements, expected", [
+    # 3 adjacent tiles with matching pattern
+    pytest.param([(0, 0, 0, Color.PINK, MATCH),
+                  (1, -1, 0, Color.BLUE, MATCH),
+                  (1, 0, -1, Color.GREEN, MATCH)], True, id="met"),
+    # 3 adjacent tiles with a pattern Millie doesn't want
+    pytest.param([(0, 0, 0, Color.PINK, OTHER),
+                  (1, -1, 0, Color.BLUE, OTHER),
+                  (1, 0, -1, Color.GREEN, OTHER)], False, id="wrong_pattern"),
+])
+def test_millie_condition(millie_setup, placements, expected):
     millie, grid = millie_setup
-    pattern = millie.patterns[0]
-
-    # Place 3 adjacent tiles with matching pattern (cube coordinates)
-    grid.set_tile(0, 0, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(1, -1, 0, Tile(Color.BLUE, pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.GREEN, pattern))
-
-    assert millie.check_condition(grid)
-
-
-def test_millie_condition_not_met(millie_setup):
-    millie, grid = millie_setup
-    # Use a pattern that's NOT in millie's preferred patterns
-    wrong_pattern = Pattern.FLOWERS
-
-    # Place 3 adjacent tiles with wrong pattern (cube coordinates)
-    grid.set_tile(0, 0, 0, Tile(Color.PINK, wrong_pattern))
-    grid.set_tile(1, -1, 0, Tile(Color.BLUE, wrong_pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.GREEN, wrong_pattern))
-
-    assert not millie.check_condition(grid)
+    place(grid, placements)
+    assert millie.check_condition(grid) == expected
 
 
 @pytest.fixture
-def leo_setup():
+def leo_setup(grid):
     """Create a Leo cat with known patterns for testing."""
     leo = CatLeo()
     leo.patterns = (Pattern.DOTS, Pattern.STRIPES)
-    grid = HexGrid()
     return leo, grid
 
 
-def test_leo_condition(leo_setup):
+@pytest.mark.parametrize("placements, expected", [
+    # Straight line of 5 along east direction (1, 0, -1)
+    pytest.param([(-2, 0, 2, Color.PINK, MATCH),
+                  (-1, 0, 1, Color.PINK, MATCH),
+                  (0, 0, 0, Color.PINK, MATCH),
+                  (1, 0, -1, Color.PINK, MATCH),
+                  (2, 0, -2, Color.PINK, MATCH)], True, id="east"),
+    # Only 4 in a line (not enough for Leo)
+    pytest.param([(-2, 0, 2, Color.PINK, MATCH),
+                  (-1, 0, 1, Color.PINK, MATCH),
+                  (0, 0, 0, Color.PINK, MATCH),
+                  (1, 0, -1, Color.PINK, MATCH)], False, id="not_met"),
+    # Line of 5 interrupted in the middle
+    pytest.param([(-2, 0, 2, Color.PINK, MATCH),
+                  (-1, 0, 1, Color.PINK, MATCH),
+                  (0, 0, 0, Color.BLUE, OTHER),
+                  (1, 0, -1, Color.PINK, MATCH),
+                  (2, 0, -2, Color.PINK, MATCH)], False, id="interrupted"),
+    # Line of 5 along northeast direction (1, -1, 0)
+    pytest.param([(-2, 2, 0, Color.PINK, MATCH),
+                  (-1, 1, 0, Color.PINK, MATCH),
+                  (0, 0, 0, Color.PINK, MATCH),
+                  (1, -1, 0, Color.PINK, MATCH),
+                  (2, -2, 0, Color.PINK, MATCH)], True, id="diagonal"),
+])
+def test_leo_condition(leo_setup, placements, expected):
     leo, grid = leo_setup
-    pattern = leo.patterns[0]
-
-    # Create a straight line of 5 tiles along east direction (cube coordinates)
-    # Direction (1, 0, -1) starting from (-2, 0, 2)
-    grid.set_tile(-2, 0, 2, Tile(Color.PINK, pattern))
-    grid.set_tile(-1, 0, 1, Tile(Color.PINK, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.PINK, pattern))
-    grid.set_tile(2, 0, -2, Tile(Color.PINK, pattern))
-
-    assert leo.check_condition(grid)
-
-
-def test_leo_condition_not_met(leo_setup):
-    leo, grid = leo_setup
-    pattern = leo.patterns[0]
-
-    # Create a straight line of only 4 tiles (not enough for Leo)
-    grid.set_tile(-2, 0, 2, Tile(Color.PINK, pattern))
-    grid.set_tile(-1, 0, 1, Tile(Color.PINK, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.PINK, pattern))
-
-    assert not leo.check_condition(grid)
-
-
-def test_leo_condition_interrupted(leo_setup):
-    leo, grid = leo_setup
-    pattern = leo.patterns[0]
-    other_pattern = Pattern.FLOWERS  # Different from leo's patterns
-
-    # Create a line of 5 tiles with an interruption in the middle
-    grid.set_tile(-2, 0, 2, Tile(Color.PINK, pattern))
-    grid.set_tile(-1, 0, 1, Tile(Color.PINK, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.BLUE, other_pattern))  # Interruption
-    grid.set_tile(1, 0, -1, Tile(Color.PINK, pattern))
-    grid.set_tile(2, 0, -2, Tile(Color.PINK, pattern))
-
-    assert not leo.check_condition(grid)
-
-
-def test_leo_condition_diagonal(leo_setup):
-    leo, grid = leo_setup
-    pattern = leo.patterns[0]
-
-    # Create a diagonal line of 5 tiles along northeast direction (1, -1, 0)
-    grid.set_tile(-2, 2, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(-1, 1, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(1, -1, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(2, -2, 0, Tile(Color.PINK, pattern))
-
-    assert leo.check_condition(grid)
+    place(grid, placements)
+    assert leo.check_condition(grid) == expected
 
 
 @pytest.fixture
-def rumi_setup():
+def rumi_setup(grid):
     """Create a Rumi cat with known patterns for testing."""
     rumi = CatRumi()
     rumi.patterns = (Pattern.DOTS, Pattern.STRIPES)
-    grid = HexGrid()
     return rumi, grid
 
 
-def test_rumi_condition(rumi_setup):
-    rumi, grid = rumi_setup
-    pattern = rumi.patterns[0]
-
-    # Create a straight line of 3 tiles (cube coordinates)
-    grid.set_tile(-1, 0, 1, Tile(Color.BLUE, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.BLUE, pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.BLUE, pattern))
-
-    assert rumi.check_condition(grid)
-
-
-def test_rumi_condition_not_met(rumi_setup):
-    rumi, grid = rumi_setup
-    pattern = rumi.patterns[0]
-
-    # Create a straight line of only 2 tiles (not enough for Rumi)
-    grid.set_tile(0, 0, 0, Tile(Color.BLUE, pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.BLUE, pattern))
-
-    assert not rumi.check_condition(grid)
-
-
-def test_rumi_condition_interrupted(rumi_setup):
-    rumi, grid = rumi_setup
-    pattern = rumi.patterns[0]
-    other_pattern = Pattern.FLOWERS  # Different from rumi's patterns
-
-    # Create a line of 3 tiles with an interruption in the middle
-    grid.set_tile(-1, 0, 1, Tile(Color.BLUE, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.YELLOW, other_pattern))  # Interruption
-    grid.set_tile(1, 0, -1, Tile(Color.BLUE, pattern))
-
-    assert not rumi.check_condition(grid)
-
-
-def test_rumi_condition_vertical(rumi_setup):
+@pytest.mark.parametrize("placements, expected", [
+    # Straight line of 3 along east direction
+    pytest.param([(-1, 0, 1, Color.BLUE, MATCH),
+                  (0, 0, 0, Color.BLUE, MATCH),
+                  (1, 0, -1, Color.BLUE, MATCH)], True, id="east"),
+    # Only 2 in a line (not enough for Rumi)
+    pytest.param([(0, 0, 0, Color.BLUE, MATCH),
+                  (1, 0, -1, Color.BLUE, MATCH)], False, id="not_met"),
+    # Line of 3 interrupted in the middle
+    pytest.param([(-1, 0, 1, Color.BLUE, MATCH),
+                  (0, 0, 0, Color.YELLOW, OTHER),
+                  (1, 0, -1, Color.BLUE, MATCH)], False, id="interrupted"),
+    # Line of 3 along northwest direction (0, -1, 1)
+    pytest.param([(0, 1, -1, Color.BLUE, MATCH),
+                  (0, 0, 0, Color.BLUE, MATCH),
+                  (0, -1, 1, Color.BLUE, MATCH)], True, id="vertical"),
+    # Line of 3 along northeast direction (1, -1, 0)
+    pytest.param([(-1, 1, 0, Color.BLUE, MATCH),
+                  (0, 0, 0, Color.BLUE, MATCH),
+                  (1, -1, 0, Color.BLUE, MATCH)], True, id="diagonal"),
+])
+def test_rumi_condition(rumi_setup, placements, expected):
     rumi, grid = rumi_setup
-    pattern = rumi.patterns[0]
-
-    # Create a line of 3 tiles along northwest direction (0, -1, 1)
-    grid.set_tile(0, 1, -1, Tile(Color.BLUE, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.BLUE, pattern))
-    grid.set_tile(0, -1, 1, Tile(Color.BLUE, pattern))
-
-    assert rumi.check_condition(grid)
-
-
-def test_rumi_condition_diagonal(rumi_setup):
-    rumi, grid = rumi_setup
-    pattern = rumi.patterns[0]
-
-    # Create a diagonal line of 3 tiles along northeast direction (1, -1, 0)
-    grid.set_tile(-1, 1, 0, Tile(Color.BLUE, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.BLUE, pattern))
-    grid.set_tile(1, -1, 0, Tile(Color.BLUE, pattern))
-
-    assert rumi.check_condition(grid)
+    place(grid, placements)
+    assert rumi.check_condition(grid) == expected
 
 
 # --- Tecolote Tests ---
 
 @pytest.fixture
-def tecolote_setup():
+def tecolote_setup(grid):
     """Create a Tecolote cat with known patterns for testing."""
     tecolote = CatTecolote()
     tecolote.patterns = (Pattern.DOTS, Pattern.STRIPES)
-    grid = HexGrid()
     return tecolote, grid
 
 
-def test_tecolote_condition(tecolote_setup):
-    tecolote, grid = tecolote_setup
-    pattern = tecolote.patterns[0]
-
-    # Create a straight line of 4 tiles along east direction (1, 0, -1)
-    grid.set_tile(-1, 0, 1, Tile(Color.PINK, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.PINK, pattern))
-    grid.set_tile(2, 0, -2, Tile(Color.PINK, pattern))
-
-    assert tecolote.check_condition(grid)
-
-
-def test_tecolote_condition_not_met_only_3(tecolote_setup):
-    tecolote, grid = tecolote_setup
-    pattern = tecolote.patterns[0]
-
-    # Create a straight line of only 3 tiles (not enough for Tecolote)
-    grid.set_tile(-1, 0, 1, Tile(Color.PINK, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.PINK, pattern))
-
-    assert not tecolote.check_condition(grid)
-
-
-def test_tecolote_condition_interrupted(tecolote_setup):
+TECOLOTE_LINE = [(-1, 0, 1, Color.PINK, MATCH),
+                 (0, 0, 0, Color.PINK, MATCH),
+                 (1, 0, -1, Color.PINK, MATCH),
+                 (2, 0, -2, Color.PINK, MATCH)]
+
+
+@pytest.mark.parametrize("placements, expected", [
+    # Straight line of 4 along east direction (1, 0, -1)
+    pytest.param(TECOLOTE_LINE, True, id="east"),
+    # Only 3 in a line (not enough for Tecolote)
+    pytest.param(TECOLOTE_LINE[:3], False, id="not_met_only_3"),
+    # Line of 4 interrupted in the middle
+    pytest.param([(-1, 0, 1, Color.PINK, MATCH),
+                  (0, 0, 0, Color.BLUE, OTHER),
+                  (1, 0, -1, Color.PINK, MATCH),
+                  (2, 0, -2, Color.PINK, MATCH)], False, id="interrupted"),
+    # Line of 4 along northeast direction (1, -1, 0)
+    pytest.param([(-1, 1, 0, Color.BLUE, MATCH),
+                  (0, 0, 0, Color.BLUE, MATCH),
+                  (1, -1, 0, Color.BLUE, MATCH),
+                  (2, -2, 0, Color.BLUE, MATCH)], True, id="diagonal"),
+    # Valid 4-tile line but with a pattern Tecolote doesn't want
+    pytest.param([(q, r, s, color, OTHER) for q, r, s, color, _ in TECOLOTE_LINE],
+                 False, id="wrong_pattern"),
+])
+def test_tecolote_condition(tecolote_setup, placements, expected):
     tecolote, grid = tecolote_setup
-    pattern = tecolote.patterns[0]
-    other_pattern = Pattern.FLOWERS  # Different from tecolote's patterns
-
-    # Create a line of 4 tiles with an interruption in the middle
-    grid.set_tile(-1, 0, 1, Tile(Color.PINK, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.BLUE, other_pattern))  # Interruption
-    grid.set_tile(1, 0, -1, Tile(Color.PINK, pattern))
-    grid.set_tile(2, 0, -2, Tile(Color.PINK, pattern))
-
-    assert not tecolote.check_condition(grid)
+    place(grid, placements)
+    assert tecolote.check_condition(grid) == expected
 
 
 def test_tecolote_scores_7_points(tecolote_setup):
     tecolote, grid = tecolote_setup
-    pattern = tecolote.patterns[0]
-
-    # Create a valid 4-tile line
-    grid.set_tile(-1, 0, 1, Tile(Color.PINK, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.PINK, pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.PINK, pattern))
-    grid.set_tile(2, 0, -2, Tile(Color.PINK, pattern))
-
+    place(grid, TECOLOTE_LINE)
     assert tecolote.score(grid) == 7
 
 
-def test_tecolote_diagonal(tecolote_setup):
-    tecolote, grid = tecolote_setup
-    pattern = tecolote.patterns[0]
-
-    # Create a diagonal line of 4 tiles along northeast direction (1, -1, 0)
-    grid.set_tile(-1, 1, 0, Tile(Color.BLUE, pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.BLUE, pattern))
-    grid.set_tile(1, -1, 0, Tile(Color.BLUE, pattern))
-    grid.set_tile(2, -2, 0, Tile(Color.BLUE, pattern))
-
-    assert tecolote.check_condition(grid)
-
-
-def test_tecolote_wrong_pattern(tecolote_setup):
-    tecolote, grid = tecolote_setup
-    # Use a pattern that's NOT in tecolote's preferred patterns
-    wrong_pattern = Pattern.FLOWERS
-
-    # Create a valid 4-tile line but with wrong pattern
-    grid.set_tile(-1, 0, 1, Tile(Color.PINK, wrong_pattern))
-    grid.set_tile(0, 0, 0, Tile(Color.PINK, wrong_pattern))
-    grid.set_tile(1, 0, -1, Tile(Color.PINK, wrong_pattern))
-    grid.set_tile(2, 0, -2, Tile(Color.PINK, wrong_pattern))
-
-    assert not tecolote.check_condition(grid)
-
-
 # --- Bucket Selection Tests ---
 
 class TestBucketConfiguration:
@@ -328,20 +255,22 @@ class TestBucketSelection:
         cats, _ = initialize_game_cats(use_buckets=True)
         assert len(cats) == 3
 
-    def test_bucket_selection_one_from_each_bucket(self):
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_bucket_selection_one_from_each_bucket(self, seed, restore_random_state):
         """Each cat should come from a different bucket."""
-        # Run multiple times to test randomness
-        for _ in range(10):
-            cats, _ = initialize_game_cats(use_buckets=True)
-
-            cat_classes = [type(cat) for cat in cats]
-
-            # One cat should be from bucket 1
-            assert any(cat_class in BUCKET_1 for cat_class in cat_classes)
-            # One cat should be from bucket 2
-            assert any(cat_class in BUCKET_2 for cat_class in cat_classes)
-            # One cat should be from bucket 3
-            assert any(cat_class in BUCKET_3 for cat_class in cat_classes)
+        # A few fixed seeds cover different draws reproducibly; cat selection
+        # draws from the global RNG, so reseed it and restore it afterwards
+        random.seed(seed)
+        cats, _ = initialize_game_cats(use_buckets=True)
+
+        cat_classes = [type(cat) for cat in cats]
+
+        # One cat should be from bucket 1
+        assert any(cat_class in BUCKET_1 for cat_class in cat_classes)
+        # One cat should be from bucket 2
+        assert any(cat_class in BUCKET_2 for cat_class in cat_classes)
+        # One cat should be from bucket 3
+        assert any(cat_class in BUCKET_3 for cat_class in cat_classes)
 
     def test_bucket_selection_patterns_non_overlapping(self):
         """All cats should have non-overlapping pattern assignments."""
@@ -2,11 +2,6 @@
 Test suite for combined place_and_choose actions.
 """
 import pytest
-import sys
-import os
-
-# Add source directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'source'))
 
 from simulation_mode import SimulationMode
 from board_configurations import BOARD_1
@@ -14,25 +9,18 @@ from game_state import Action, TurnPhase
 from mcts_agent import MCTSNode, MCTSAgent
 
 
-def complete_goal_selection(game):
-    """Helper to complete goal selection phase and transition to tile placement."""
-    if game.turn_phase == TurnPhase.GOAL_SELECTION:
-        actions = game.get_legal_actions()
-        game.apply_action(actions[0])
-    return game
+@pytest.fixture(scope="module")
+def initial_actions(fresh_game):
+    """Combined and separate legal actions for the shared fresh_game."""
+    return fresh_game.get_combined_legal_actions(), fresh_game.get_legal_actions()
 
 
 class TestCombinedActionGeneration:
     """Tests for get_combined_legal_actions()."""
 
-    def test_combined_actions_count(self):
+    def test_combined_actions_count(self, initial_actions):
         """Combined actions should be positions x hand_tiles x market_tiles."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        state = game.get_game_state()
-
-        combined = game.get_combined_legal_actions()
-        separate = game.get_legal_actions()
+        combined, separate = initial_actions
 
         # Combined should be 3x the separate place actions (one for each market choice)
         place_actions = [a for a in separate if a.action_type == "place_tile"]
@@ -40,11 +28,9 @@ class TestCombinedActionGeneration:
 
         assert len(combined) == expected_combined
 
-    def test_combined_actions_have_all_fields(self):
+    def test_combined_actions_have_all_fields(self, initial_actions):
         """Combined actions should have position, hand_index, and market_index."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        combined = game.get_combined_legal_actions()
+        combined, _ = initial_actions
 
         for action in combined:
             assert action.action_type == "place_and_choose"
@@ -52,11 +38,8 @@ class TestCombinedActionGeneration:
             assert action.hand_index is not None
             assert action.market_index is not None  # Not final turn yet
 
-    def test_combined_actions_only_in_place_phase(self):
+    def test_combined_actions_only_in_place_phase(self, game):
         """Combined actions should only be generated in PLACE_TILE phase."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-
         # Move to market phase
         actions = game.get_legal_actions()
         game.apply_action(actions[0])
@@ -90,10 +73,8 @@ class TestCombinedActionGeneration:
 class TestCombinedActionExecution:
     """Tests for _do_place_and_choose()."""
 
-    def test_combined_action_places_tile(self):
+    def test_combined_action_places_tile(self, game):
         """Combined action should place a tile on the board."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
         initial_empty = len(game.player.grid.get_empty_positions())
 
         combined = game.get_combined_legal_actions()
@@ -105,11 +86,8 @@ class TestCombinedActionExecution:
         new_empty = len(game.player.grid.get_empty_positions())
         assert new_empty == initial_empty - 1
 
-    def test_combined_action_takes_market_tile(self):
+    def test_combined_action_takes_market_tile(self, game):
         """Combined action should take the specified market tile."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        initial_hand = list(game.player.tiles)
         market_tile_to_take = game.market.tiles[1]  # Index 1
 
         # Find a combined action with market_index=1
@@ -122,10 +100,8 @@ class TestCombinedActionExecution:
         assert len(game.player.tiles) == 2
         assert market_tile_to_take in game.player.tiles
 
-    def test_combined_action_advances_turn(self):
+    def test_combined_action_advances_turn(self, game):
         """Combined action should advance to next turn."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
         assert game.turn_number == 0
 
         combined = game.get_combined_legal_actions()
@@ -135,16 +111,13 @@ class TestCombinedActionExecution:
         assert game.turn_number == 1
         assert game.turn_phase == TurnPhase.PLACE_TILE
 
-    def test_combined_action_game_completion(self):
+    def test_combined_action_game_completion(self, game):
         """Game should complete with only combined actions."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
 
-        while not game.is_game_over():
-            combined = game.get_combined_legal_actions()
-            if not combined:
-                break
-            game.apply_action(combined[0])
+        # Every combined action ends the turn, so the phase flips to
+        # GAME_OVER exactly when the board fills
+        while game.turn_phase == TurnPhase.PLACE_TILE:
+            game.apply_action(game.get_combined_legal_actions()[0])
 
         assert game.is_game_over()
         score = game.get_final_score()
@@ -154,11 +127,9 @@ class TestCombinedActionExecution:
 class TestMCTSWithCombinedActions:
     """Tests for MCTS using combined actions."""
 
-    def test_mcts_returns_combined_action(self):
+    def test_mcts_returns_combined_action(self, game, mcts_test_iters):
         """MCTS with combined actions should return place_and_choose."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        agent = MCTSAgent(max_iterations=50, use_combined_actions=True)
+        agent = MCTSAgent(max_iterations=mcts_test_iters, use_combined_actions=True)
 
         action = agent.select_action(game)
 
@@ -167,11 +138,9 @@ class TestMCTSWithCombinedActions:
         assert action.hand_index is not None
         assert action.market_index is not None
 
-    def test_mcts_separate_returns_place_tile(self):
+    def test_mcts_separate_returns_place_tile(self, game, mcts_test_iters):
         """MCTS with separate actions should return place_tile in place phase."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        agent = MCTSAgent(max_iterations=50, use_combined_actions=False)
+        agent = MCTSAgent(max_iterations=mcts_test_iters, use_combined_actions=False)
 
         action = agent.select_action(game)
 
@@ -179,20 +148,16 @@ class TestMCTSWithCombinedActions:
         assert action.position is not None
         assert action.hand_index is not None
 
-    def test_mcts_node_uses_combined_actions(self):
+    def test_mcts_node_uses_combined_actions(self, game):
         """MCTSNode should use combined actions when configured."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        node = MCTSNode(state=game.copy(), use_combined_actions=True)
+        node = MCTSNode(state=game, use_combined_actions=True)
 
         for action in node.untried_actions:
             assert action.action_type == "place_and_choose"
 
-    def test_mcts_node_propagates_flag(self):
+    def test_mcts_node_propagates_flag(self, game):
         """Expanded children should inherit use_combined_actions flag."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        root = MCTSNode(state=game.copy(), use_combined_actions=True)
+        root = MCTSNode(state=game, use_combined_actions=True)
 
         child = root.expand()
 
@@ -200,13 +165,11 @@ class TestMCTSWithCombinedActions:
         for action in child.untried_actions:
             assert action.action_type == "place_and_choose"
 
-    def test_mcts_completes_game_with_combined(self):
+    def test_mcts_completes_game_with_combined(self, game, mcts_test_iters):
         """MCTS should complete a game using only combined actions."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        agent = MCTSAgent(max_iterations=50, use_combined_actions=True)
+        agent = MCTSAgent(max_iterations=mcts_test_iters, use_combined_actions=True)
 
-        while not game.is_game_over():
+        while game.turn_phase == TurnPhase.PLACE_TILE:
             action = agent.select_action(game)
             assert action.action_type == "place_and_choose"
             game.apply_action(action)
@@ -219,23 +182,14 @@ class TestMCTSWithCombinedActions:
 class TestRandomGameWithCombinedActions:
     """Tests for play_random_game with combined actions."""
 
-    def test_random_game_combined(self):
-        """Random game with combined actions should complete."""
-        game = SimulationMode(BOARD_1)
-        score = game.play_random_game(use_combined_actions=True)
-        assert score >= 0
-        assert game.is_game_over()
-
-    def test_random_game_separate(self):
-        """Random game with separate actions should complete."""
-        game = SimulationMode(BOARD_1)
-        score = game.play_random_game(use_combined_actions=False)
-        assert score >= 0
-        assert game.is_game_over()
-
-    def test_random_game_default_combined(self):
-        """Random game should default to combined actions."""
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param({"use_combined_actions": True}, id="combined"),
+        pytest.param({"use_combined_actions": False}, id="separate"),
+        pytest.param({}, id="default_combined"),
+    ])
+    def test_random_game(self, kwargs):
+        """Random game should complete with either action style (default: combined)."""
         game = SimulationMode(BOARD_1)
-        score = game.play_random_game()  # Default
+        score = game.play_random_game(**kwargs)
         assert score >= 0
         assert game.is_game_over()
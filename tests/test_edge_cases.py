@@ -1,11 +1,6 @@
 import pytest
-import sys
-import os
 
-# Add source directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'source'))
-
-from tile import Tile, Color, Pattern
+from tile import Tile, Color, Pattern, canonical_tile
 from tile_bag import TileBag
 from market import Market
 from player import Player
@@ -208,8 +203,13 @@ class TestPlayModeEdgeCases:
         result = game.try_place_at_position(100, 100, -200)
         assert result is False
 
-    def test_get_legal_actions_game_over(self):
-        game = SimulationMode(BOARD_1)
-        game.play_random_game()
+    def test_get_legal_actions_game_over(self, game):
+        # Fill the board directly rather than playing a whole game
+        filler = canonical_tile(Color.BLUE, Pattern.DOTS)
+        game.player.grid.set_tiles(
+            (q, r, s, filler) for q, r, s in game.player.grid.get_empty_positions()
+        )
+        game.invalidate_caches()
+        assert game.is_game_over()
         actions = game.get_legal_actions()
         assert len(actions) == 0
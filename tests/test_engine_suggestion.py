@@ -5,10 +5,6 @@ Tests the ScoreBreakdown, CandidateInfo, and engine suggestion
 functionality in PlayMode.
 """
 import pytest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'source'))
 
 from simulation_mode import SimulationMode
 from play_mode import PlayMode
@@ -23,6 +19,17 @@ from heuristic import (
 from game_state import TurnPhase
 
 
+@pytest.fixture(scope="module")
+def initial_evaluation(fresh_game):
+    """Evaluations of the shared post-goal-selection game, computed once."""
+    return {
+        "breakdown": evaluate_state_with_breakdown(fresh_game),
+        "cats": evaluate_cats_with_reasons(fresh_game),
+        "goals": evaluate_goals_with_reasons(fresh_game),
+        "buttons": evaluate_buttons_with_reasons(fresh_game.player.grid),
+    }
+
+
 class TestScoreBreakdown:
     """Tests for the ScoreBreakdown dataclass."""
 
@@ -79,31 +86,21 @@ class TestScoreBreakdown:
 class TestEvaluateStateWithBreakdown:
     """Tests for evaluate_state_with_breakdown function."""
 
-    def test_returns_score_breakdown(self):
+    def test_returns_score_breakdown(self, initial_evaluation):
         """Function returns a ScoreBreakdown object."""
-        game = SimulationMode()
-        # Skip goal selection
-        game.apply_action(game.get_legal_actions()[0])
-
-        breakdown = evaluate_state_with_breakdown(game)
+        breakdown = initial_evaluation["breakdown"]
         assert isinstance(breakdown, ScoreBreakdown)
         assert breakdown.total >= 0  # May be 0 for empty board
 
-    def test_breakdown_matches_total(self):
+    def test_breakdown_matches_total(self, initial_evaluation):
         """Component scores should approximately sum to total."""
-        game = SimulationMode()
-        game.apply_action(game.get_legal_actions()[0])
-
-        breakdown = evaluate_state_with_breakdown(game)
+        breakdown = initial_evaluation["breakdown"]
         component_sum = breakdown.cat_score + breakdown.goal_score + breakdown.button_score
         # Allow small floating point differences
         assert abs(breakdown.total - component_sum) < 0.1
 
-    def test_reasons_are_populated(self):
+    def test_reasons_are_populated(self, game):
         """Breakdown should include at least some reasons."""
-        game = SimulationMode()
-        game.apply_action(game.get_legal_actions()[0])
-
         # Play a few moves to create some state
         for _ in range(5):
             if game.is_game_over():
@@ -136,13 +133,10 @@ class TestCandidateInfo:
         assert candidate.visits == 100
         assert candidate.avg_score == 65.5
 
-    def test_action_description_place_and_choose(self):
+    def test_action_description_place_and_choose(self, game):
         """action_description formats place_and_choose actions."""
         from game_state import Action
 
-        game = SimulationMode()
-        game.apply_action(game.get_legal_actions()[0])
-
         action = Action(
             action_type="place_and_choose",
             position=(0, 0, 0),
@@ -158,12 +152,9 @@ class TestCandidateInfo:
 class TestMCTSDetailedAnalysis:
     """Tests for select_action_with_detailed_analysis method."""
 
-    def test_returns_candidates_with_breakdown(self):
+    def test_returns_candidates_with_breakdown(self, game, mcts_test_iters):
         """Method returns list of CandidateInfo with breakdowns."""
-        game = SimulationMode()
-        game.apply_action(game.get_legal_actions()[0])
-
-        agent = MCTSAgent(max_iterations=50)  # Low iterations for speed
+        agent = MCTSAgent(max_iterations=mcts_test_iters)
         best_action, candidates = agent.select_action_with_detailed_analysis(game, n_candidates=3)
 
         assert best_action is not None
@@ -174,24 +165,19 @@ class TestMCTSDetailedAnalysis:
             assert candidate.visits >= 0
             assert isinstance(candidate.avg_score, float)
 
-    def test_candidates_sorted_by_visits(self):
+    def test_candidates_sorted_by_visits(self, game):
         """Candidates should be sorted by visit count (descending)."""
-        game = SimulationMode()
-        game.apply_action(game.get_legal_actions()[0])
-
-        agent = MCTSAgent(max_iterations=100)
+        # Enough iterations for visit counts to differ
+        agent = MCTSAgent(max_iterations=20)
         _, candidates = agent.select_action_with_detailed_analysis(game, n_candidates=5)
 
         if len(candidates) > 1:
             for i in range(len(candidates) - 1):
                 assert candidates[i].visits >= candidates[i + 1].visits
 
-    def test_best_action_matches_first_candidate(self):
+    def test_best_action_matches_first_candidate(self, game, mcts_test_iters):
         """Best action should match the first candidate's action."""
-        game = SimulationMode()
-        game.apply_action(game.get_legal_actions()[0])
-
-        agent = MCTSAgent(max_iterations=50)
+        agent = MCTSAgent(max_iterations=mcts_test_iters)
         best_action, candidates = agent.select_action_with_detailed_analysis(game)
 
         if candidates:
@@ -209,23 +195,25 @@ class TestPlayModeEngineSuggestion:
         assert play_mode.engine_computing is False
         assert play_mode.engine_iterations == 1000
 
-    def test_toggle_on(self):
+    def test_toggle_on(self, mcts_test_iters):
         """Toggling on triggers computation."""
         play_mode = PlayMode()
         # Complete goal selection first
         play_mode.goal_slot_assignments = [0, 1, 2]
         play_mode.confirm_goal_selection()
+        play_mode.engine_iterations = mcts_test_iters
 
         play_mode.toggle_engine_suggestion()
         assert play_mode.show_engine_suggestion is True
         # Should have computed candidates (synchronously for now)
         assert play_mode.engine_candidates is not None
 
-    def test_toggle_off(self):
+    def test_toggle_off(self, mcts_test_iters):
         """Toggling off hides suggestions."""
         play_mode = PlayMode()
         play_mode.goal_slot_assignments = [0, 1, 2]
         play_mode.confirm_goal_selection()
+        play_mode.engine_iterations = mcts_test_iters
 
         play_mode.toggle_engine_suggestion()  # On
         play_mode.toggle_engine_suggestion()  # Off
@@ -263,11 +251,12 @@ class TestPlayModeEngineSuggestion:
         play_mode.adjust_engine_iterations(increase=True)
         assert play_mode.engine_iterations == 100000  # Clamped to maximum
 
-    def test_cache_cleared_on_action(self):
+    def test_cache_cleared_on_action(self, mcts_test_iters):
         """Engine cache is cleared when an action is taken."""
         play_mode = PlayMode()
         play_mode.goal_slot_assignments = [0, 1, 2]
         play_mode.confirm_goal_selection()
+        play_mode.engine_iterations = mcts_test_iters
 
         play_mode.toggle_engine_suggestion()
         assert play_mode.engine_candidates is not None
@@ -329,32 +318,23 @@ class TestSimulationModeFromGameMode:
 class TestEvaluationHelpers:
     """Tests for the evaluation helper functions with reasons."""
 
-    def test_evaluate_cats_with_reasons(self):
+    def test_evaluate_cats_with_reasons(self, initial_evaluation):
         """evaluate_cats_with_reasons returns score and reasons."""
-        game = SimulationMode()
-        game.apply_action(game.get_legal_actions()[0])
-
-        score, reasons = evaluate_cats_with_reasons(game)
+        score, reasons = initial_evaluation["cats"]
         assert isinstance(score, float)
         assert isinstance(reasons, list)
         assert score >= 0
 
-    def test_evaluate_goals_with_reasons(self):
+    def test_evaluate_goals_with_reasons(self, initial_evaluation):
         """evaluate_goals_with_reasons returns score and reasons."""
-        game = SimulationMode()
-        game.apply_action(game.get_legal_actions()[0])
-
-        score, reasons = evaluate_goals_with_reasons(game)
+        score, reasons = initial_evaluation["goals"]
         assert isinstance(score, float)
         assert isinstance(reasons, list)
         assert score >= 0
 
-    def test_evaluate_buttons_with_reasons(self):
+    def test_evaluate_buttons_with_reasons(self, initial_evaluation):
         """evaluate_buttons_with_reasons returns score and reasons."""
-        game = SimulationMode()
-        game.apply_action(game.get_legal_actions()[0])
-
-        score, reasons = evaluate_buttons_with_reasons(game.player.grid)
+        score, reasons = initial_evaluation["buttons"]
         assert isinstance(score, float)
         assert isinstance(reasons, list)
         assert score >= 0
@@ -1,35 +1,27 @@
 """
 Tests for game metadata serialization.
 """
-import pytest
-import sys
-import os
+import json
+from dataclasses import asdict
 
-# Add source directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'source'))
+import pytest
 
-from simulation_mode import SimulationMode
-from board_configurations import BOARD_1
+import game_metadata
 from game_metadata import GameMetadata, extract_game_metadata
-from game_state import TurnPhase
 
 
-def complete_goal_selection(game):
-    """Helper to complete goal selection phase and transition to tile placement."""
-    if game.turn_phase == TurnPhase.GOAL_SELECTION:
-        actions = game.get_legal_actions()
-        game.apply_action(actions[0])
-    return game
+@pytest.fixture(scope="module")
+def base_metadata(fresh_game):
+    """Metadata for the shared post-goal-selection game; tests only read it."""
+    return GameMetadata.from_game(fresh_game)
 
 
 class TestGameMetadata:
     """Tests for GameMetadata class."""
 
-    def test_from_game_captures_cats(self):
+    def test_from_game_captures_cats(self, base_metadata):
         """Should capture cat names and patterns from game."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = GameMetadata.from_game(game)
+        metadata = base_metadata
 
         assert len(metadata.cat_names) == 3
         assert len(metadata.cat_points) == 3
@@ -39,11 +31,18 @@ class TestGameMetadata:
         for patterns in metadata.cat_patterns:
             assert len(patterns) == 2
 
-    def test_from_game_captures_goals(self):
+    def test_cat_patterns_are_tuples(self, base_metadata):
+        """Cat patterns should be immutable tuples, even when built from lists."""
+        assert isinstance(base_metadata.cat_patterns, tuple)
+        assert all(isinstance(p, tuple) for p in base_metadata.cat_patterns)
+
+        metadata = GameMetadata(cat_patterns=[["DOTS", "LEAVES"]])
+        assert metadata.cat_patterns == (("DOTS", "LEAVES"),)
+        hash(metadata.cat_patterns)
+
+    def test_from_game_captures_goals(self, base_metadata):
         """Should capture goal names and positions from game."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = GameMetadata.from_game(game)
+        metadata = base_metadata
 
         assert len(metadata.goal_names) == 3
         assert len(metadata.goal_positions) == 3
@@ -52,11 +51,9 @@ class TestGameMetadata:
         for position in metadata.goal_positions:
             assert len(position) == 3
 
-    def test_to_mlflow_params(self):
+    def test_to_mlflow_params(self, base_metadata):
         """Should convert to MLflow parameters dict."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = GameMetadata.from_game(game)
+        metadata = base_metadata
         params = metadata.to_mlflow_params()
 
         # Should have cat parameters
@@ -75,11 +72,9 @@ class TestGameMetadata:
         # Should have board
         assert "board_name" in params
 
-    def test_to_mlflow_tags(self):
+    def test_to_mlflow_tags(self, base_metadata):
         """Should convert to MLflow tags dict."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = GameMetadata.from_game(game)
+        metadata = base_metadata
         tags = metadata.to_mlflow_tags()
 
         assert "cats" in tags
@@ -90,11 +85,9 @@ class TestGameMetadata:
         assert "," in tags["cats"]  # Multiple cats
         assert "," in tags["goals"]  # Multiple goals
 
-    def test_json_roundtrip(self):
+    def test_json_roundtrip(self, base_metadata):
         """Should serialize to and from JSON."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        original = GameMetadata.from_game(game)
+        original = base_metadata
 
         json_str = original.to_json()
         restored = GameMetadata.from_json(json_str)
@@ -106,11 +99,27 @@ class TestGameMetadata:
         assert restored.goal_positions == original.goal_positions
         assert restored.board_name == original.board_name
 
-    def test_from_mlflow_params(self):
+    def test_from_json_accepts_stdlib_json(self, base_metadata):
+        """JSON written by the stdlib encoder should load regardless of backend."""
+        restored = GameMetadata.from_json(json.dumps(asdict(base_metadata)))
+        assert restored == base_metadata
+
+    def test_json_roundtrip_without_orjson(self, base_metadata, monkeypatch):
+        """The stdlib fallback should round-trip on its own."""
+        monkeypatch.setattr(game_metadata, "orjson", None)
+        restored = GameMetadata.from_json(base_metadata.to_json())
+        assert restored == base_metadata
+
+    def test_json_backends_produce_same_output(self, base_metadata, monkeypatch):
+        """orjson and stdlib json should emit identical strings for this (str/int only) metadata."""
+        pytest.importorskip("orjson")
+        fast = base_metadata.to_json()
+        monkeypatch.setattr(game_metadata, "orjson", None)
+        assert base_metadata.to_json() == fast
+
+    def test_from_mlflow_params(self, base_metadata):
         """Should reconstruct from MLflow parameters."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        original = GameMetadata.from_game(game)
+        original = base_metadata
 
         params = original.to_mlflow_params()
         restored = GameMetadata.from_mlflow_params(params)
@@ -120,11 +129,9 @@ class TestGameMetadata:
         assert restored.goal_names == original.goal_names
         assert restored.board_name == original.board_name
 
-    def test_summary(self):
+    def test_summary(self, base_metadata):
         """Should produce human-readable summary."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = GameMetadata.from_game(game)
+        metadata = base_metadata
         summary = metadata.summary()
 
         assert "Cats:" in summary
@@ -135,11 +142,9 @@ class TestGameMetadata:
 class TestExtractGameMetadata:
     """Tests for the convenience function."""
 
-    def test_extract_game_metadata(self):
+    def test_extract_game_metadata(self, fresh_game):
         """Should extract metadata from game."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = extract_game_metadata(game)
+        metadata = extract_game_metadata(fresh_game)
 
         assert isinstance(metadata, GameMetadata)
         assert len(metadata.cat_names) == 3
@@ -149,11 +154,9 @@ class TestExtractGameMetadata:
 class TestGoalArrangementKeys:
     """Tests for goal arrangement tracking keys."""
 
-    def test_goal_arrangement_key_format(self):
+    def test_goal_arrangement_key_format(self, base_metadata):
         """Should produce key with goal@position format."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = GameMetadata.from_game(game)
+        metadata = base_metadata
         key = metadata.get_goal_arrangement_key()
 
         # Key should have 3 parts separated by |
@@ -166,21 +169,17 @@ class TestGoalArrangementKeys:
             assert "(" in part
             assert ")" in part
 
-    def test_goal_arrangement_key_sorted(self):
+    def test_goal_arrangement_key_sorted(self, base_metadata):
         """Key should be sorted for consistent ordering."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = GameMetadata.from_game(game)
+        metadata = base_metadata
         key = metadata.get_goal_arrangement_key()
 
         parts = key.split("|")
         assert parts == sorted(parts)
 
-    def test_goals_only_key_format(self):
+    def test_goals_only_key_format(self, base_metadata):
         """Should produce sorted comma-separated goal names."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = GameMetadata.from_game(game)
+        metadata = base_metadata
         key = metadata.get_goals_only_key()
 
         # Should have comma-separated goal names
@@ -188,11 +187,9 @@ class TestGoalArrangementKeys:
         assert len(goal_names) == 3
         assert goal_names == sorted(goal_names)
 
-    def test_setup_key_includes_all_components(self):
+    def test_setup_key_includes_all_components(self, base_metadata):
         """Setup key should include board, cats, and goal arrangement."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        metadata = GameMetadata.from_game(game)
+        metadata = base_metadata
         key = metadata.get_setup_key()
 
         # Should contain board name
@@ -1,8 +1,12 @@
+import copy
+import pickle
+
 import pytest
 from game_state import GameState, Action, TurnPhase
 from simulation_mode import SimulationMode
 from play_mode import PlayMode
 from board_configurations import BOARD_1
+from tile import canonical_tile
 
 
 def complete_goal_selection(game):
@@ -36,6 +40,17 @@ class TestSimulationMode:
         assert len(actions) == 2 * empty_count
         assert all(a.action_type == "place_tile" for a in actions)
 
+    def test_get_legal_actions_refreshes_after_action(self):
+        game = SimulationMode(BOARD_1)
+        complete_goal_selection(game)
+        actions = game.get_legal_actions()
+        assert isinstance(actions, tuple)  # Shared cache; callers can't consume it
+        assert game.get_legal_actions() is actions
+
+        game.apply_action(actions[0])
+        assert game.turn_phase == TurnPhase.CHOOSE_MARKET
+        assert all(a.action_type == "choose_market" for a in game.get_legal_actions())
+
     def test_apply_place_action(self):
         game = SimulationMode(BOARD_1)
         complete_goal_selection(game)
@@ -140,6 +155,8 @@ class TestSimulationMode:
         game = SimulationMode(BOARD_1)
         complete_goal_selection(game)
         hash1 = game.get_state_hash()
+        assert game.get_state_hash() == hash1
+        assert game.copy().get_state_hash() == hash1
 
         # Make a move
         actions = game.get_legal_actions()
@@ -149,6 +166,46 @@ class TestSimulationMode:
         # Hashes should be different after state change
         assert hash1 != hash2
 
+    def test_direct_edits_refresh_after_invalidate_caches(self):
+        game = SimulationMode(BOARD_1)
+        complete_goal_selection(game)
+        hash1 = game.get_state_hash()
+        actions1 = game.get_legal_actions()
+
+        # A copy edited directly never sees the original's cached values
+        clone = game.copy()
+        q, r, s = clone.player.grid.get_empty_positions()[0]
+        clone.player.grid.set_tile(q, r, s, clone.player.tiles[0])
+        assert clone.get_state_hash() != hash1
+        assert len(clone.get_legal_actions()) == len(actions1) - 2
+
+        # The original keeps its caches until told the state changed
+        game.player.grid.set_tile(q, r, s, game.player.tiles[0])
+        assert game.get_state_hash() == hash1
+        game.invalidate_caches()
+        assert game.get_state_hash() == clone.get_state_hash()
+        assert len(game.get_legal_actions()) == len(actions1) - 2
+
+    @pytest.mark.parametrize("mode", [SimulationMode, PlayMode])
+    @pytest.mark.parametrize("clone", [
+        lambda game: pickle.loads(pickle.dumps(game)),
+        copy.deepcopy,
+    ], ids=["pickle", "deepcopy"])
+    def test_game_survives_pickle_and_deepcopy(self, mode, clone):
+        game = mode(BOARD_1)
+        restored = clone(game)
+        assert restored.board_config == game.board_config
+        assert restored.turn_phase == TurnPhase.GOAL_SELECTION
+
+        complete_goal_selection(game)
+        restored = clone(game)
+        assert restored.get_game_state() == game.get_game_state()
+        assert restored.get_final_score() == game.get_final_score()
+        # Cloned tiles resolve back to the shared instances
+        tiles = [t for t in restored.player.grid.grid.values() if t is not None]
+        tiles += restored.player.tiles
+        assert all(t is canonical_tile(t.color, t.pattern) for t in tiles)
+
 
 class TestPlayMode:
     def test_initial_state_after_goal_selection(self):
@@ -261,14 +318,15 @@ class TestPlayMode:
 
     def test_game_over_status(self):
         game = PlayMode(BOARD_1)
+        complete_goal_selection(game)
 
-        # Play to completion using simulation logic
-        # Keep playing until we reach GAME_OVER phase
-        while game.turn_phase != TurnPhase.GAME_OVER:
-            actions = game.get_legal_actions()
-            if not actions:
-                break
-            game.apply_action(actions[0])
+        # Fill all but one position directly, then let the last placement
+        # move the game to GAME_OVER
+        filler = game.player.tiles[0]
+        empty = game.player.grid.get_empty_positions()
+        game.player.grid.set_tiles((q, r, s, filler) for q, r, s in empty[1:])
+        game.apply_action(game.get_legal_actions()[0])
+        assert game.turn_phase == TurnPhase.GAME_OVER
 
         assert "Game Over" in game.get_status_message()
         assert str(game.get_final_score()) in game.get_status_message()
@@ -1,143 +1,105 @@
 """
-Tests for game recording and tile tracking.
+Tests for game recording.
 """
 import pytest
-import sys
-import os
-import tempfile
+import io
 import json
 
-# Add source directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'source'))
-
 from tile import Tile, Color, Pattern
-from simulation_mode import SimulationMode
-from board_configurations import BOARD_1
 from mcts_agent import MCTSAgent
+import game_record
 from game_record import (
     GameRecord, DecisionRecord, CandidateMove, TileRecord,
     CatRecord, GoalRecord, GameRecorder
 )
-from game_state import TurnPhase
 
 
-def complete_goal_selection(game):
-    """Helper to complete goal selection phase and transition to tile placement."""
-    if game.turn_phase == TurnPhase.GOAL_SELECTION:
-        actions = game.get_legal_actions()
-        game.apply_action(actions[0])
-    return game
+TILE_CASES = [
+    (Color.BLUE, Pattern.DOTS),
+    (Color.GREEN, Pattern.SWIRLS),
+    (Color.PINK, Pattern.FLOWERS),
+    (Color.YELLOW, Pattern.LEAVES),
+    (Color.PURPLE, Pattern.CLUBS),
+    (Color.TEAL, Pattern.STRIPES),
+]
+
+PLACE_TILE_CANDIDATE = dict(
+    action_type="place_tile", position=(1, -1, 0), hand_index=0,
+    market_index=None, visits=50, avg_score=25.5,
+)
+CHOOSE_MARKET_CANDIDATE = dict(
+    action_type="choose_market", position=None, hand_index=None,
+    market_index=2, visits=30, avg_score=18.3,
+)
 
 
 class TestTileRecord:
     """Tests for TileRecord serialization."""
 
-    def test_from_tile(self):
+    @pytest.mark.parametrize("color,pattern", TILE_CASES)
+    def test_from_tile(self, color, pattern):
         """TileRecord should capture tile color and pattern."""
-        tile = Tile(Color.BLUE, Pattern.DOTS)
-        record = TileRecord.from_tile(tile)
+        record = TileRecord.from_tile(Tile(color, pattern))
 
-        assert record.color == "BLUE"
-        assert record.pattern == "DOTS"
+        assert record.color == color.name
+        assert record.pattern == pattern.name
 
-    def test_to_tile(self):
+    @pytest.mark.parametrize("color,pattern", TILE_CASES)
+    def test_to_tile(self, color, pattern):
         """TileRecord should reconstruct original tile."""
-        record = TileRecord(color="GREEN", pattern="SWIRLS")
-        tile = record.to_tile()
-
-        assert tile.color == Color.GREEN
-        assert tile.pattern == Pattern.SWIRLS
-
-    def test_roundtrip(self):
-        """Converting tile to record and back should preserve data."""
-        original = Tile(Color.PINK, Pattern.FLOWERS)
-        record = TileRecord.from_tile(original)
-        reconstructed = record.to_tile()
+        tile = TileRecord(color=color.name, pattern=pattern.name).to_tile()
 
-        assert reconstructed.color == original.color
-        assert reconstructed.pattern == original.pattern
+        assert tile.color == color
+        assert tile.pattern == pattern
 
-    def test_to_dict(self):
-        """TileRecord should serialize to dict."""
-        record = TileRecord(color="YELLOW", pattern="LEAVES")
-        d = record.to_dict()
+    @pytest.mark.parametrize("color,pattern", TILE_CASES)
+    def test_roundtrip(self, color, pattern):
+        """Converting tile to record and back should give the same tile."""
+        original = Tile(color, pattern)
+        assert TileRecord.from_tile(original).to_tile() is original
 
-        assert d["color"] == "YELLOW"
-        assert d["pattern"] == "LEAVES"
-
-    def test_from_dict(self):
-        """TileRecord should deserialize from dict."""
-        d = {"color": "PURPLE", "pattern": "CLUBS"}
+    @pytest.mark.parametrize("color,pattern", TILE_CASES)
+    def test_dict_roundtrip(self, color, pattern):
+        """TileRecord should serialize to and from a plain dict."""
+        d = {"color": color.name, "pattern": pattern.name}
         record = TileRecord.from_dict(d)
 
-        assert record.color == "PURPLE"
-        assert record.pattern == "CLUBS"
+        assert record == TileRecord(color=color.name, pattern=pattern.name)
+        assert record.to_dict() == d
 
 
 class TestCandidateMove:
     """Tests for CandidateMove serialization."""
 
-    def test_place_tile_candidate(self):
-        """Should serialize place_tile candidates."""
-        candidate = CandidateMove(
-            action_type="place_tile",
-            position=(1, -1, 0),
-            hand_index=0,
-            market_index=None,
-            visits=50,
-            avg_score=25.5
-        )
-
-        d = candidate.to_dict()
-        assert d["action_type"] == "place_tile"
-        assert d["position"] == [1, -1, 0]
-        assert d["hand_index"] == 0
-        assert d["visits"] == 50
-        assert d["avg_score"] == 25.5
-
-    def test_choose_market_candidate(self):
-        """Should serialize choose_market candidates."""
-        candidate = CandidateMove(
-            action_type="choose_market",
-            position=None,
-            hand_index=None,
-            market_index=2,
-            visits=30,
-            avg_score=18.3
-        )
-
-        d = candidate.to_dict()
-        assert d["action_type"] == "choose_market"
-        assert d["position"] is None
-        assert d["market_index"] == 2
-
-    def test_roundtrip(self):
+    @pytest.mark.parametrize("fields,expected", [
+        (PLACE_TILE_CANDIDATE, {
+            "action_type": "place_tile", "position": [1, -1, 0],
+            "hand_index": 0, "visits": 50, "avg_score": 25.5,
+        }),
+        (CHOOSE_MARKET_CANDIDATE, {
+            "action_type": "choose_market", "position": None, "market_index": 2,
+        }),
+    ])
+    def test_to_dict(self, fields, expected):
+        """Should serialize place_tile and choose_market candidates."""
+        d = CandidateMove(**fields).to_dict()
+        for key, value in expected.items():
+            assert d[key] == value
+
+    @pytest.mark.parametrize("fields", [PLACE_TILE_CANDIDATE, CHOOSE_MARKET_CANDIDATE])
+    def test_roundtrip(self, fields):
         """Serialization should be reversible."""
-        original = CandidateMove(
-            action_type="place_tile",
-            position=(0, 0, 0),
-            hand_index=1,
-            market_index=None,
-            visits=100,
-            avg_score=45.0
-        )
-
-        d = original.to_dict()
-        restored = CandidateMove.from_dict(d)
+        original = CandidateMove(**fields)
+        restored = CandidateMove.from_dict(original.to_dict())
 
-        assert restored.action_type == original.action_type
-        assert restored.position == original.position
-        assert restored.hand_index == original.hand_index
-        assert restored.visits == original.visits
+        assert restored == original
 
 
 class TestGameRecorder:
     """Tests for GameRecorder."""
 
-    def test_recorder_creation(self):
+    def test_recorder_creation(self, game):
         """Recorder should initialize with game and config."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
         config = {"max_iterations": 100}
 
         recorder = GameRecorder(game, config)
@@ -146,10 +108,8 @@ class TestGameRecorder:
         assert len(recorder.cats) == 3
         assert len(recorder.goals) == 3
 
-    def test_record_decision(self):
+    def test_record_decision(self, game):
         """Recorder should capture decisions."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
         config = {"max_iterations": 50}
         recorder = GameRecorder(game, config)
 
@@ -165,10 +125,8 @@ class TestGameRecorder:
         assert decision.turn_number == 0
         assert decision.action_type == action.action_type
 
-    def test_finalize_creates_record(self):
+    def test_finalize_creates_record(self, game):
         """Finalize should create complete GameRecord."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
         config = {"max_iterations": 50}
         recorder = GameRecorder(game, config)
 
@@ -192,10 +150,8 @@ class TestGameRecorder:
 class TestGameRecord:
     """Tests for GameRecord serialization."""
 
-    def test_save_and_load(self):
+    def test_save_and_load(self, game, tmp_path):
         """GameRecord should save to and load from JSON."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
         config = {"max_iterations": 50}
         recorder = GameRecorder(game, config)
 
@@ -210,86 +166,107 @@ class TestGameRecord:
 
         record = recorder.finalize()
 
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            filepath = f.name
-
-        try:
-            record.save(filepath)
-
-            # Load it back
-            loaded = GameRecord.load(filepath)
+        # Save to a file on disk
+        filepath = tmp_path / "record.json"
+        record.save(filepath)
+
+        # Load it back
+        loaded = GameRecord.load(filepath)
+
+        assert loaded.timestamp == record.timestamp
+        assert loaded.mcts_config == record.mcts_config
+        assert loaded.final_score == record.final_score
+        assert len(loaded.decisions) == len(record.decisions)
+        assert len(loaded.cats) == len(record.cats)
+        assert len(loaded.goals) == len(record.goals)
+
+        # File stays plain JSON whichever encoder wrote it
+        with open(filepath) as f:
+            assert json.load(f) == record.to_dict()
+
+
+@pytest.fixture(scope="module")
+def recorded_game(fresh_game):
+    """A full MCTS game played once with recording, shared by integration tests."""
+    game = fresh_game.copy()
+    agent = MCTSAgent(max_iterations=20)
+    config = {
+        "max_iterations": agent.max_iterations,
+        "exploration_constant": agent.exploration_constant,
+    }
+    recorder = GameRecorder(game, config)
+
+    # Play the full game with recording
+    while not game.is_game_over():
+        action, candidates = agent.select_action_with_analysis(game)
+        recorder.record_decision(action, candidates)
+        game.apply_action(action)
 
-            assert loaded.timestamp == record.timestamp
-            assert loaded.mcts_config == record.mcts_config
-            assert loaded.final_score == record.final_score
-            assert len(loaded.decisions) == len(record.decisions)
-            assert len(loaded.cats) == len(record.cats)
-            assert len(loaded.goals) == len(record.goals)
-        finally:
-            os.unlink(filepath)
+    return game, recorder.finalize()
 
 
 class TestIntegrationRecording:
     """Integration tests for recording during MCTS."""
 
-    def test_record_full_game(self):
+    def test_record_full_game(self, recorded_game):
         """Should record a complete MCTS game."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        agent = MCTSAgent(max_iterations=20)
-        config = {
-            "max_iterations": agent.max_iterations,
-            "exploration_constant": agent.exploration_constant,
-        }
-        recorder = GameRecorder(game, config)
-
-        # Play the full game with recording
-        while not game.is_game_over():
-            action, candidates = agent.select_action_with_analysis(game)
-            recorder.record_decision(action, candidates)
-            game.apply_action(action)
-
-        record = recorder.finalize()
+        game, record = recorded_game
 
         # Verify record completeness
         assert record.final_score == game.get_final_score()
         assert len(record.decisions) > 0
         assert all(len(d.candidates) > 0 for d in record.decisions)
 
-    def test_recorded_game_save_load(self):
+    def test_recorded_game_save_load(self, recorded_game):
         """Recorded game should survive save/load cycle."""
-        game = SimulationMode(BOARD_1)
-        complete_goal_selection(game)
-        agent = MCTSAgent(max_iterations=10)
-        recorder = GameRecorder(game, {"iterations": 10})
-
-        # Play a few moves
-        for _ in range(5):
-            if game.is_game_over():
-                break
-            action, candidates = agent.select_action_with_analysis(game)
-            recorder.record_decision(action, candidates)
-            game.apply_action(action)
-
-        original = recorder.finalize()
-
-        # Save and reload
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            filepath = f.name
-
-        try:
-            original.save(filepath)
-            loaded = GameRecord.load(filepath)
-
-            # Verify key data preserved
-            assert loaded.final_score == original.final_score
-            assert len(loaded.decisions) == len(original.decisions)
-
-            # Verify decision details preserved
-            for orig_d, load_d in zip(original.decisions, loaded.decisions):
-                assert orig_d.turn_number == load_d.turn_number
-                assert orig_d.action_type == load_d.action_type
-                assert len(orig_d.candidates) == len(load_d.candidates)
-        finally:
-            os.unlink(filepath)
+        _, original = recorded_game
+
+        # Save and reload in memory
+        buf = io.BytesIO()
+        original.save(buf)
+        buf.seek(0)
+        loaded = GameRecord.load(buf)
+
+        # Verify key data preserved
+        assert loaded.final_score == original.final_score
+        assert len(loaded.decisions) == len(original.decisions)
+
+        # Verify decision details preserved
+        for orig_d, load_d in zip(original.decisions, loaded.decisions):
+            assert orig_d.turn_number == load_d.turn_number
+            assert orig_d.action_type == load_d.action_type
+            assert len(orig_d.candidates) == len(load_d.candidates)
+
+    @pytest.mark.parametrize("write_mode,read_mode", [("wb", "rb"), ("w", "r")])
+    def test_save_load_through_open_file(self, recorded_game, tmp_path, write_mode, read_mode):
+        """save/load should accept binary and text file objects, not only paths."""
+        _, original = recorded_game
+        filepath = tmp_path / "record.json"
+
+        with open(filepath, write_mode) as f:
+            original.save(f)
+        with open(filepath, read_mode) as f:
+            loaded = GameRecord.load(f)
+
+        assert loaded.to_dict() == original.to_dict()
+        assert json.loads(filepath.read_bytes()) == original.to_dict()
+
+    def test_save_load_without_orjson(self, recorded_game, monkeypatch):
+        """The stdlib fallback should round-trip a full record on its own."""
+        _, original = recorded_game
+        monkeypatch.setattr(game_record, "orjson", None)
+
+        buf = io.BytesIO()
+        original.save(buf)
+        buf.seek(0)
+        loaded = GameRecord.load(buf)
+
+        assert loaded.to_dict() == original.to_dict()
+
+    def test_json_backends_produce_same_bytes(self, recorded_game, monkeypatch):
+        """orjson and stdlib json should write byte-identical files."""
+        pytest.importorskip("orjson")
+        _, original = recorded_game
+        fast = original.to_json_bytes()
+        monkeypatch.setattr(game_record, "orjson", None)
+        assert original.to_json_bytes() == fast
@@ -6,14 +6,20 @@ from goal import (
     create_goals_from_selection,
     ALL_GOAL_CLASSES,
 )
-from simulation_mode import SimulationMode
-from board_configurations import BOARD_1, GOAL_POSITIONS
+from board_configurations import GOAL_POSITIONS
+
+
+@pytest.fixture
+def game(pristine_game):
+    """A private copy of a BOARD_1 game that has not selected goals yet."""
+    return pristine_game.copy()
 
 
 class TestCreateGoalOptions:
     def test_returns_four_goals(self):
         classes = create_goal_options()
         assert len(classes) == 4
+        assert isinstance(classes, tuple)
 
     def test_goals_are_goal_classes(self):
         classes = create_goal_options()
@@ -59,34 +65,27 @@ class TestCreateGoalsFromSelection:
 
 
 class TestGoalSelectionPhase:
-    def test_game_starts_in_goal_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_game_starts_in_goal_selection(self, game):
         assert game.turn_phase == TurnPhase.GOAL_SELECTION
 
-    def test_four_goal_options_available(self):
-        game = SimulationMode(BOARD_1)
+    def test_four_goal_options_available(self, game):
         assert len(game.goal_options) == 4
 
-    def test_no_goals_before_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_no_goals_before_selection(self, game):
         assert len(game.goals) == 0
 
-    def test_no_tiles_before_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_no_tiles_before_selection(self, game):
         assert len(game.player.tiles) == 0
 
-    def test_no_market_before_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_no_market_before_selection(self, game):
         assert game.market is None
 
-    def test_legal_actions_returns_24_options(self):
-        game = SimulationMode(BOARD_1)
+    def test_legal_actions_returns_24_options(self, game):
         actions = game.get_legal_actions()
         assert len(actions) == 24
         assert all(a.action_type == "select_goals" for a in actions)
 
-    def test_each_action_has_unique_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_each_action_has_unique_selection(self, game):
         actions = game.get_legal_actions()
 
         selections = set()
@@ -95,33 +94,36 @@ class TestGoalSelectionPhase:
 
         assert len(selections) == 24
 
-    def test_apply_selection_transitions_to_place_tile(self):
-        game = SimulationMode(BOARD_1)
+    def test_legal_actions_are_shared_and_immutable(self, game, pristine_game):
+        actions = game.get_legal_actions()
+        other = pristine_game.copy().get_legal_actions()
+
+        assert all(a is b for a, b in zip(actions, other))
+        assert isinstance(actions, tuple)
+        assert game.get_legal_actions() is actions
+
+    def test_apply_selection_transitions_to_place_tile(self, game):
         actions = game.get_legal_actions()
         game.apply_action(actions[0])
         assert game.turn_phase == TurnPhase.PLACE_TILE
 
-    def test_tiles_drawn_after_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_tiles_drawn_after_selection(self, game):
         actions = game.get_legal_actions()
         game.apply_action(actions[0])
         assert len(game.player.tiles) == 2
 
-    def test_market_initialized_after_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_market_initialized_after_selection(self, game):
         actions = game.get_legal_actions()
         game.apply_action(actions[0])
         assert game.market is not None
         assert len(game.market.tiles) == 3
 
-    def test_goals_created_from_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_goals_created_from_selection(self, game):
         actions = game.get_legal_actions()
         game.apply_action(actions[0])
         assert len(game.goals) == 3
 
-    def test_selected_goals_match_action(self):
-        game = SimulationMode(BOARD_1)
+    def test_selected_goals_match_action(self, game):
         action = game.get_legal_actions()[5]  # Pick a specific action
         selected_classes = [game.goal_options[i] for i in action.selected_goal_indices]
 
@@ -132,23 +134,20 @@ class TestGoalSelectionPhase:
 
 
 class TestGoalSelectionCopy:
-    def test_copy_during_goal_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_copy_during_goal_selection(self, game):
         game_copy = game.copy()
 
         assert game_copy.turn_phase == TurnPhase.GOAL_SELECTION
         assert len(game_copy.goal_options) == 4
         assert len(game_copy.goals) == 0
 
-    def test_copy_shares_goal_options(self):
-        game = SimulationMode(BOARD_1)
+    def test_copy_shares_goal_options(self, game):
         game_copy = game.copy()
 
         # Goal options list is shared (immutable classes)
         assert game_copy.goal_options is game.goal_options
 
-    def test_copy_is_independent(self):
-        game = SimulationMode(BOARD_1)
+    def test_copy_is_independent(self, game):
         game_copy = game.copy()
 
         # Modify original
@@ -159,8 +158,7 @@ class TestGoalSelectionCopy:
         assert game_copy.turn_phase == TurnPhase.GOAL_SELECTION
         assert len(game_copy.goals) == 0
 
-    def test_copy_after_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_copy_after_selection(self, game):
         game.apply_action(game.get_legal_actions()[0])
 
         game_copy = game.copy()
@@ -172,8 +170,7 @@ class TestGoalSelectionCopy:
 
 
 class TestGoalSelectionActionHistory:
-    def test_selection_recorded_in_history(self):
-        game = SimulationMode(BOARD_1)
+    def test_selection_recorded_in_history(self, game):
         action = game.get_legal_actions()[0]
         game.apply_action(action)
 
@@ -181,8 +178,7 @@ class TestGoalSelectionActionHistory:
         assert len(history) == 1
         assert history[0].action_type == "select_goals"
 
-    def test_full_game_includes_selection(self):
-        game = SimulationMode(BOARD_1)
+    def test_full_game_includes_selection(self, game):
         game.play_random_game()
 
         history = game.get_action_history()
@@ -190,16 +186,14 @@ class TestGoalSelectionActionHistory:
 
 
 class TestPlayRandomGameWithGoalSelection:
-    def test_random_game_completes(self):
-        game = SimulationMode(BOARD_1)
+    def test_random_game_completes(self, game):
         score = game.play_random_game()
 
         assert game.is_game_over()
         assert game.turn_phase == TurnPhase.GAME_OVER
         assert score >= 0
 
-    def test_random_game_selects_goals_first(self):
-        game = SimulationMode(BOARD_1)
+    def test_random_game_selects_goals_first(self, game):
         game.play_random_game()
 
         # First action should be goal selection
@@ -1,9 +1,7 @@
-import pytest
-import sys
-import os
+import random
+from collections import Counter
 
-# Add source directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'source'))
+import pytest
 
 from goal import (
     GoalAAA_BBB, GoalAA_BB_CC, GoalAllUnique,
@@ -11,10 +9,15 @@ from goal import (
     create_default_goals, create_random_goals, ALL_GOAL_CLASSES
 )
 from hex_grid import HexGrid
-from tile import Tile, Color, Pattern
+from tile import Tile, Color, Pattern, ALL_COLORS, ALL_PATTERNS
 from game_state import TurnPhase
 
 
+def _counter_profile(values):
+    """Counts of each distinct value, largest first."""
+    return tuple(sorted(Counter(values).values(), reverse=True))
+
+
 def complete_goal_selection(game):
     """Helper to complete goal selection phase and transition to tile placement."""
     if game.turn_phase == TurnPhase.GOAL_SELECTION:
@@ -57,7 +60,7 @@ class TestGoalAAA_BBB:
     def test_pattern_3_3_scores_8(self):
         # All different colors, but 3 dots and 3 leaves
         neighbors = self.get_neighbor_positions()
-        colors = list(Color)[:6]
+        colors = ALL_COLORS
         for i, pos in enumerate(neighbors):
             pattern = Pattern.DOTS if i < 3 else Pattern.LEAVES
             self.grid.set_tile(*pos, Tile(colors[i], pattern))
@@ -82,6 +85,26 @@ class TestGoalAAA_BBB:
         assert self.goal.score(self.grid) == 0
 
 
+class TestGoalTileProfiles:
+    """Tests for the neighbor profile helper shared by every goal."""
+
+    def test_neighbor_profiles_match_counter(self):
+        """The packed-histogram profiles should agree with a Counter for every input."""
+        rng = random.Random(0)
+        grid = HexGrid()
+        goal = GoalAAA_BBB((-2, 1, 1))
+        for _ in range(200):
+            grid.clear()
+            tiles = [Tile(rng.choice(ALL_COLORS), rng.choice(ALL_PATTERNS)) for _ in range(6)]
+            for pos, tile in zip(grid.get_neighbors(-2, 1, 1), tiles):
+                grid.set_tile(*pos, tile)
+
+            assert goal._neighbor_profiles(grid) == (
+                _counter_profile(t.color for t in tiles),
+                _counter_profile(t.pattern for t in tiles),
+            )
+
+
 class TestGoalAA_BB_CC:
     """Test the AA-BB-CC goal (2 each of 3 types)."""
 
@@ -107,7 +130,7 @@ class TestGoalAA_BB_CC:
     def test_pattern_2_2_2_scores_7(self):
         # All different colors, 2 dots, 2 leaves, 2 flowers
         neighbors = self.get_neighbor_positions()
-        colors = list(Color)[:6]
+        colors = ALL_COLORS
         patterns = [Pattern.DOTS, Pattern.DOTS, Pattern.LEAVES, Pattern.LEAVES,
                    Pattern.FLOWERS, Pattern.FLOWERS]
         for i, pos in enumerate(neighbors):
@@ -151,7 +174,7 @@ class TestGoalAllUnique:
     def test_unique_colors_scores_10(self):
         # 6 different colors, same pattern
         neighbors = self.get_neighbor_positions()
-        colors = list(Color)[:6]
+        colors = ALL_COLORS
         for i, pos in enumerate(neighbors):
             self.grid.set_tile(*pos, Tile(colors[i], Pattern.DOTS))
         assert self.goal.score(self.grid) == 10
@@ -159,7 +182,7 @@ class TestGoalAllUnique:
     def test_unique_patterns_scores_10(self):
         # Same color, 6 different patterns
         neighbors = self.get_neighbor_positions()
-        patterns = list(Pattern)[:6]
+        patterns = ALL_PATTERNS
         for i, pos in enumerate(neighbors):
             self.grid.set_tile(*pos, Tile(Color.BLUE, patterns[i]))
         assert self.goal.score(self.grid) == 10
@@ -167,8 +190,8 @@ class TestGoalAllUnique:
     def test_both_unique_scores_15(self):
         # 6 different colors AND 6 different patterns
         neighbors = self.get_neighbor_positions()
-        colors = list(Color)[:6]
-        patterns = list(Pattern)[:6]
+        colors = ALL_COLORS
+        patterns = ALL_PATTERNS
         for i, pos in enumerate(neighbors):
             self.grid.set_tile(*pos, Tile(colors[i], patterns[i]))
         assert self.goal.score(self.grid) == 15
@@ -177,7 +200,7 @@ class TestGoalAllUnique:
         # 5 different colors (one duplicate), 6 different patterns
         neighbors = self.get_neighbor_positions()
         colors = [Color.BLUE, Color.PINK, Color.GREEN, Color.YELLOW, Color.PURPLE, Color.BLUE]
-        patterns = list(Pattern)[:6]
+        patterns = ALL_PATTERNS
         for i, pos in enumerate(neighbors):
             self.grid.set_tile(*pos, Tile(colors[i], patterns[i]))
         assert self.goal.score(self.grid) == 10  # Only pattern condition met
@@ -224,7 +247,7 @@ class TestGoalAAAA_BB:
     def test_pattern_4_2_scores_7(self):
         # All different colors, but 4 dots and 2 leaves
         neighbors = self.get_neighbor_positions()
-        colors = list(Color)[:6]
+        colors = ALL_COLORS
         for i, pos in enumerate(neighbors):
             pattern = Pattern.DOTS if i < 4 else Pattern.LEAVES
             self.grid.set_tile(*pos, Tile(colors[i], pattern))
@@ -282,7 +305,7 @@ class TestGoalAA_BB_C_D:
     def test_pattern_2_2_1_1_scores_5(self):
         # All different colors, 2 dots, 2 leaves, 1 flowers, 1 stripes
         neighbors = self.get_neighbor_positions()
-        colors = list(Color)[:6]
+        colors = ALL_COLORS
         patterns = [Pattern.DOTS, Pattern.DOTS, Pattern.LEAVES, Pattern.LEAVES,
                     Pattern.FLOWERS, Pattern.STRIPES]
         for i, pos in enumerate(neighbors):
@@ -343,7 +366,7 @@ class TestGoalAAA_BB_C:
     def test_pattern_3_2_1_scores_7(self):
         # All different colors, 3 dots, 2 leaves, 1 flowers
         neighbors = self.get_neighbor_positions()
-        colors = list(Color)[:6]
+        colors = ALL_COLORS
         patterns = [Pattern.DOTS, Pattern.DOTS, Pattern.DOTS,
                     Pattern.LEAVES, Pattern.LEAVES, Pattern.FLOWERS]
         for i, pos in enumerate(neighbors):
@@ -9,13 +9,6 @@ Tests cover:
 - Overlap decay for redundant lines
 - Line enumeration including edge tiles
 """
-import sys
-import os
-
-# Add source directory to path so imports work the same way as in source modules
-source_dir = os.path.join(os.path.dirname(__file__), '..', 'source')
-sys.path.insert(0, source_dir)
-
 import pytest
 from hex_grid import HexGrid, Color, Pattern
 from tile import Tile
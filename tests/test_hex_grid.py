@@ -32,4 +32,46 @@ def test_grid_string_representation():
     tile = Tile(Color.BLUE, Pattern.DOTS)
     grid.set_tile(0, 0, 0, tile)
     grid_str = str(grid)
-    assert "BD" in grid_str  # Check if the tile is represented in the string (Blue Dots = BD)
\ No newline at end of file
+    assert "BD" in grid_str  # Check if the tile is represented in the string (Blue Dots = BD)
+
+
+def test_clear_removes_tiles_and_keeps_layout():
+    grid = HexGrid()
+    grid.set_goal_positions([(0, 0, 0)])
+    grid.set_tile(1, -1, 0, Tile(Color.BLUE, Pattern.DOTS))
+    positions = list(grid.grid)
+    grid.clear()
+    assert list(grid.grid) == positions
+    assert all(tile is None for tile in grid.grid.values())
+    assert grid.is_goal_position(0, 0, 0)
+
+
+def test_set_tiles_places_each_entry():
+    grid = HexGrid()
+    pink = Tile(Color.PINK, Pattern.DOTS)
+    blue = Tile(Color.BLUE, Pattern.STRIPES)
+    grid.set_tiles([(0, 0, 0, pink), (1, -1, 0, blue)])
+    assert grid.get_tile(0, 0, 0) is pink
+    assert grid.get_tile(1, -1, 0) is blue
+    with pytest.raises(ValueError):
+        grid.set_tiles([(9, 9, -18, pink)])
+
+
+def test_empty_positions_follow_placements_in_grid_order():
+    grid = HexGrid()
+    tile = Tile(Color.PINK, Pattern.DOTS)
+    order = list(grid.grid)
+    grid.set_tiles([(0, 0, 0, tile), (1, -1, 0, tile)])
+    assert grid.get_empty_positions() == [p for p in order if p not in {(0, 0, 0), (1, -1, 0)}]
+    grid.set_tile(0, 0, 0, None)
+    assert grid.get_empty_positions() == [p for p in order if p != (1, -1, 0)]
+    grid.clear()
+    assert grid.get_empty_positions() == order
+
+
+def test_has_empty_positions_false_once_full():
+    grid = HexGrid()
+    tile = Tile(Color.PINK, Pattern.DOTS)
+    assert grid.has_empty_positions()
+    grid.set_tiles((q, r, s, tile) for q, r, s in grid.get_empty_positions())
+    assert not grid.has_empty_positions()
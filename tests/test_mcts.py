@@ -2,11 +2,6 @@
 Test suite for MCTS agent.
 """
 import pytest
-import sys
-import os
-
-# Add source directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'source'))
 
 from simulation_mode import SimulationMode
 from board_configurations import BOARD_1
@@ -159,6 +154,28 @@ class TestMCTSNode:
 
         best = parent.best_child(1.4)
         assert best is child2
+        assert best.ucb1_score(1.4) == max(c.ucb1_score(1.4) for c in parent.children)
+
+    def test_best_child_prefers_unvisited_even_at_unvisited_parent(self):
+        """An unvisited child wins without needing ln(parent_visits)."""
+        game = SimulationMode(BOARD_1)
+        parent = MCTSNode(state=game.copy())
+        parent.visits = 0
+
+        visited = MCTSNode(state=game.copy(), parent=parent)
+        visited.visits = 5
+        visited.total_score = 50.0
+        unvisited = MCTSNode(state=game.copy(), parent=parent)
+
+        parent.children = [visited, unvisited]
+
+        assert parent.best_child(1.4) is unvisited
+
+    def test_best_child_without_children_raises(self):
+        """best_child on a leaf should fail loudly, not return None."""
+        parent = MCTSNode(state=SimulationMode(BOARD_1))
+        with pytest.raises(ValueError):
+            parent.best_child(1.4)
 
 
 class TestMCTSAgent:
@@ -8,7 +8,7 @@ from collections import Counter
 
 from source.simulation_mode import SimulationMode
 from source.board_configurations import BOARD_1
-from source.tile import Color, Pattern, Tile
+from source.tile import Color, Pattern, Tile, ALL_COLORS, ALL_PATTERNS
 from source.hex_grid import HexGrid
 from source.goal import GoalAAA_BBB, GoalAA_BB_CC, GoalAllUnique
 from source.cat import CatMillie, CatLeo, CatRumi
@@ -131,7 +131,7 @@ class TestVerboseScoring:
         # Reset and test color-only
         grid = HexGrid()
         print("\n  Test 2: 3 BLUE + 3 PINK (different patterns each)")
-        patterns = list(Pattern)
+        patterns = ALL_PATTERNS
         for i, pos in enumerate(neighbors):
             color = Color.BLUE if i < 3 else Color.PINK
             grid.set_tile(*pos, Tile(color, patterns[i]))
@@ -170,7 +170,7 @@ class TestVerboseScoring:
         grid = HexGrid()
         print("\n  Test 2: 2-2-2 colors only (6 different patterns)")
         colors = [Color.BLUE, Color.BLUE, Color.PINK, Color.PINK, Color.GREEN, Color.GREEN]
-        patterns = list(Pattern)[:6]
+        patterns = ALL_PATTERNS
         for i, pos in enumerate(neighbors):
             grid.set_tile(*pos, Tile(colors[i], patterns[i]))
 
@@ -191,8 +191,8 @@ class TestVerboseScoring:
 
         # Setup: 6 unique colors AND 6 unique patterns (should score 15)
         print("\n  Test 1: 6 unique colors AND 6 unique patterns")
-        colors = list(Color)[:6]
-        patterns = list(Pattern)[:6]
+        colors = ALL_COLORS
+        patterns = ALL_PATTERNS
         for i, pos in enumerate(neighbors):
             grid.set_tile(*pos, Tile(colors[i], patterns[i]))
 
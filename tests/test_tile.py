@@ -1,5 +1,6 @@
 from source.hex_grid import Color, Pattern
 from source.tile import Tile
+from source import goal
 
 def test_tile_creation():
     tile = Tile(Color.BLUE, Pattern.DOTS)
@@ -17,3 +18,28 @@ def test_tile_representation_contains_color_and_pattern():
     tile_str = str(tile)
     assert "BLUE" in tile_str.upper() or "BL" in tile_str.upper()
     assert "DOTS" in tile_str.upper() or "DO" in tile_str.upper()
+
+def test_tile_constructor_returns_shared_instance():
+    from source.hex_grid import Tile as FlatTile, canonical_tile
+    tile = FlatTile(Color.BLUE, Pattern.DOTS)
+    assert tile is FlatTile(Color.BLUE, Pattern.DOTS)
+    assert tile is canonical_tile(Color.BLUE, Pattern.DOTS)
+    assert tile is not FlatTile(Color.BLUE, Pattern.STRIPES)
+
+def test_tile_copy_and_pickle_keep_shared_instance():
+    import copy
+    import pickle
+    from source.hex_grid import canonical_tile
+    tile = canonical_tile(Color.TEAL, Pattern.SWIRLS)
+    assert copy.copy(tile) is tile
+    assert copy.deepcopy(tile) is tile
+    assert pickle.loads(pickle.dumps(tile)) is tile
+
+def test_color_and_pattern_are_int_valued():
+    assert isinstance(Color.BLUE, int) and isinstance(Pattern.DOTS, int)
+    assert int(Color.PINK) == 1 and int(Pattern.SWIRLS) == 6
+    # Members index lists directly, as goal._NIBBLE[tile.color] relies on
+    assert ["x", "pink", "blue"][Color.BLUE] == "blue"
+    assert goal._NIBBLE[Color.BLUE] == goal._NIBBLE[2]
+    assert {Color.BLUE: "x"}[Color.BLUE] == "x"
+    assert Color.BLUE.name == "BLUE"